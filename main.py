@@ -18,10 +18,10 @@ import webbrowser
 # ======================================================
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QAction, 
-    QAbstractButton, QSizePolicy, QGridLayout
+    QAbstractButton, QSizePolicy, QGridLayout, QCompleter
 )
 from PyQt5.QtGui import QIcon, QPixmap, QDesktopServices
-from PyQt5.QtCore import Qt, QEvent, QEasingCurve, QTimer, QUrl
+from PyQt5.QtCore import Qt, QEvent, QEasingCurve, QPoint, QTimer, QUrl
 from PyQt5.uic import loadUi
 
 # ======================================================
@@ -46,7 +46,16 @@ from structure.widgets.option_menu import OptionMenu
 from structure.styles.apply_qss import StyleManager
 from structure.threads.sounds_effects import SoundTrack
 from structure.threads.pokemon_loader import PokemonLoader
-from structure.threads.app_state import ConnectionManager
+from structure.threads.fetch_service import FetchService
+from structure.threads.rate_limiter import FetchPriority
+from structure.threads.api_pokemon import FetchProfile
+from structure.threads.retry_queue import RetryQueue
+from structure.threads.scroll_prefetcher import ScrollPrefetcher
+from structure.threads.thumbnail_cache import ImageVariant
+from structure.threads.image_loader import ImageLoader, placeholder_pixmap
+from structure.threads.pixmap_cache import PixmapCache
+from structure.threads.viewport_images import ViewportImages
+from structure.threads.data_sources import create_source
 
 from structure.styles.stats_animator import StatsAnimator
 from structure.styles.apply_typeStyleSheet import (
@@ -120,13 +129,24 @@ class MainApp(QMainWindow):
         # Loaded and failed pokemon tracking
         self._loaded_pokemon_ids = set()
         self._cached_grid_widgets = []
-        self._failed_widgets = set()
+
+        # Failed cards, retried with backoff behind a circuit breaker
+        self.retry_queue = RetryQueue(self)
 
         # UI and connection flags
         self.is_initial_loading = False
         self._connection_error_shown = False
         self._is_searching = False
 
+        # Pending search request (cancelled when superseded)
+        self.search_loader = None
+
+        # Pending reload of the detail fields missing from the open page
+        self.backfill_loader = None
+
+        # Pending decode of the detail page artwork
+        self.page_image_loader = None
+
         # Audio state
         self.current_track = None
         self.sound_track = None
@@ -213,6 +233,7 @@ class MainApp(QMainWindow):
         self.btn_start.clicked.connect(self._startPokedex)
         self.btn_more.clicked.connect(self._loadMorePokemon)
         self.btn_retry.clicked.connect(self._retryFailedPokemon)
+        self.retry_queue.changed.connect(self._onRetryQueueChanged)
 
         self.btn_search.clicked.connect(self._searchPokemon)
         self.btn_settings.clicked.connect(self.show_messageNotification)
@@ -236,6 +257,38 @@ class MainApp(QMainWindow):
         # Connect range_num_pokemon to reload pokedex
         self.config_page.range_num_pokemon.valueChanged.connect(self._onNumPokemonChanged)
 
+        # Memory budget of the image cache shared by cards and detail page
+        self.config_page.range_image_cache.valueChanged.connect(self._onImageCacheChanged)
+        self._onImageCacheChanged(self.config_page.cfg.imageCacheMB.value)
+
+        # Prefetch depth and budget applied live to the scroll prefetcher
+        self.config_page.range_prefetch_depth.valueChanged.connect(self._onPrefetchSettingsChanged)
+        self.config_page.range_prefetch_budget.valueChanged.connect(self._onPrefetchSettingsChanged)
+
+        # Data source chosen in the settings (HTTP or local api-data mirror)
+        cfg = self.config_page.cfg
+        FetchService.configure(
+            create_source(cfg.dataSource.value, cfg.apiBaseUrl.value, cfg.mirrorPath.value),
+            decode_in_process=cfg.decodeInProcess.value
+        )
+
+        # Name/ID directory used by search, autocomplete and batch planning
+        self.fetch_service = FetchService.instance()
+        self.fetch_service.directoryReady.connect(self._onDirectoryReady)
+
+        if self.fetch_service.directory:
+            self._onDirectoryReady()
+
+        # Online/offline changes inferred by the fetch layer
+        self.fetch_service.connectivity.stateChanged.connect(self._onConnectivityChanged)
+
+        # Next batches fetched ahead while the user scrolls down
+        self.prefetcher = ScrollPrefetcher(self.scrollArea, self._prefetchIds, self)
+        self._onPrefetchSettingsChanged()
+
+        # Card images follow the viewport: loaded when near, released when far
+        self.viewport_images = ViewportImages(self.scrollArea, lambda: self._all_pokemon_widgets, self)
+
     def _openEmailClient(self):
 
         email = "devBluePhoenix77@gmail.com"
@@ -495,9 +548,9 @@ class MainApp(QMainWindow):
 
     def _startPokedex(self):
 
-        if not ConnectionManager.has_internet():
-            self._showConnectionWarning("No se detectó conexión a internet. No es posible iniciar la Pokédex.")
-            return
+        # Offline start: saved Pokémon show up, the rest load on reconnect
+        if not self.fetch_service.connectivity.online:
+            self._showConnectionWarning("No se detectó conexión a internet. Se mostrarán los Pokémon guardados.")
 
         # Leave start button
         self.is_welcome = False
@@ -532,6 +585,30 @@ class MainApp(QMainWindow):
             duration=4000
         ).show()
 
+    def _onConnectivityChanged(self, online: bool):
+
+        if not online:
+            self._showConnectionWarning("Se perdió la conexión a internet. Las cargas pendientes seguirán al volver la conexión.")
+
+            # First batch cut short: show what already loaded
+            if self.is_initial_loading and self._pokemon_loaded:
+                self._onAllPokemonLoaded()
+
+            return
+
+        # Replay the cards that failed while offline
+        self._retryFailedPokemon()
+
+        InfoBar.success(
+            parent=self,
+            title="Conexión restablecida",
+            content="Vuelves a estar conectado a internet.",
+            orient=Qt.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=3000
+        ).show()
+
     def _showPokedexFlyout(self):
 
         icon_pixmap = QPixmap("resources/icons/buttons/icon_pokemon/pikachu.svg").scaled(
@@ -578,24 +655,81 @@ class MainApp(QMainWindow):
         if self.is_initial_loading:
             self._showPokedexFlyout()
 
+        # Never plan loads past the last known species
+        batch_size = self._batch_size
+        directory = self.fetch_service.directory
+
+        if directory:
+            batch_size = min(batch_size, directory.max_species_id - self._next_pokemon_id + 1)
+
+        if batch_size <= 0:
+            self._showManagedInfoBar(
+                title="Pokédex completa",
+                message="Ya se han cargado todos los Pokémon disponibles."
+            )
+            return
+
         # Reset batch counters
         self._pokemon_loaded = 0
-        self._pokemon_to_load = self._batch_size
+        self._pokemon_to_load = batch_size
 
         # Create Pokemon widgets sequentially
-        for _ in range(self._batch_size):
-            self._addPokemonWidget(self._next_pokemon_id)
+        for _ in range(batch_size):
+
+            # Cards that land inside the viewport are fetched first
+            priority = self._cardPriority(self._current_row)
+
+            self._addPokemonWidget(self._next_pokemon_id, priority)
             self._next_pokemon_id += 1
 
-    def _addPokemonWidget(self, pokemon_id: int):
+    def _prefetchIds(self, depth: int) -> list[int]:
 
-        widget = WidgetPokemon(pokemon_id, self)
+        # Nothing to get ahead of before the first batch or while searching
+        if self.is_initial_loading or self._is_searching or not self._all_pokemon_widgets:
+            return []
+
+        last_id = self._next_pokemon_id + self._batch_size * depth - 1
+        directory = self.fetch_service.directory
+
+        if directory:
+            last_id = min(last_id, directory.max_species_id)
+
+        return list(range(self._next_pokemon_id, last_id + 1))
+
+    def _cardPriority(self, row: int) -> FetchPriority:
+        """Fetch priority of a card placed on a grid row, from where the row sits against the viewport."""
+
+        row_height = 171 + self.pokedex_layout.verticalSpacing()
+
+        # Row position inside the scrolled content
+        grid_top = self.area_pokemon.mapTo(self.scrollArea.widget(), QPoint(0, 0)).y()
+        top = grid_top + self.pokedex_layout.contentsMargins().top() + row * row_height
+        bottom = top + 171
+
+        view_height = self.scrollArea.viewport().height()
+        view_top = self.scrollArea.verticalScrollBar().value()
+        view_bottom = view_top + view_height
+
+        if bottom > view_top and top < view_bottom:
+            return FetchPriority.VISIBLE
+
+        # Next screen down: the user reaches it first
+        if top < view_bottom + view_height:
+            return FetchPriority.OFFSCREEN
+
+        return FetchPriority.PREFETCH
+
+    def _addPokemonWidget(self, pokemon_id: int, priority: FetchPriority = FetchPriority.VISIBLE):
+
+        widget = WidgetPokemon(pokemon_id, self, priority)
         self._all_pokemon_widgets.append(widget)
 
         # Connect widget lifecycle signals
         widget.loaded.connect(self._onPokemonLoaded)
+        widget.loaded.connect(self.viewport_images.schedule)
         widget.failed.connect(self._onPokemonFailed)
         widget.selected.connect(self._openPokemonApiPage)
+        widget.detailsFailed.connect(self._showConnectionWarning)
 
         self.pokedex_layout.addWidget(
             widget,
@@ -626,13 +760,33 @@ class MainApp(QMainWindow):
         self._pokemon_loaded += 1
         self._updateRetryAndMoreButtons()
 
+        # Offline start: show the saved Pokémon, the rest wait for the connection
+        offline_start = self.is_initial_loading and not self.fetch_service.connectivity.online
+
         # When the batch finishes loading
-        if self._pokemon_loaded >= self._pokemon_to_load:
+        if self._pokemon_loaded >= self._pokemon_to_load or offline_start:
             self._onAllPokemonLoaded()
 
     def _onPokemonFailed(self, widget: WidgetPokemon):
 
-        self._failed_widgets.add(widget)
+        self.retry_queue.add(widget)
+
+        # ----- OFFLINE ERROR: replayed when the connection returns -----
+        if not self.fetch_service.connectivity.online:
+
+            if not self._connection_error_shown:
+                self._connection_error_shown = True
+                self._showConnectionWarning("Sin conexión. Los Pokémon pendientes se cargarán al volver la conexión.")
+
+            self._updateRetryAndMoreButtons()
+
+            # Show the Pokémon served locally instead of an empty Pokédex
+            settled = self._pokemon_loaded + len(self.retry_queue) >= self._pokemon_to_load
+
+            if self.is_initial_loading and self._pokemon_loaded and settled:
+                self._onAllPokemonLoaded()
+
+            return
 
         # ----- INITIAL LOAD ERROR -----
         if self.is_initial_loading:
@@ -644,7 +798,7 @@ class MainApp(QMainWindow):
         # ----- POST-INITIAL ERROR -----
         if not self._connection_error_shown:
             self._connection_error_shown = True
-            self._showConnectionWarning("Falta de conexión a internet para cargar los datos.")
+            self._showConnectionWarning("Falta de conexión a internet para cargar los datos. Se reintentará automáticamente.")
 
         self._updateRetryAndMoreButtons()
 
@@ -654,7 +808,7 @@ class MainApp(QMainWindow):
 
     def _updateRetryAndMoreButtons(self):
 
-        if self._failed_widgets:
+        if self.retry_queue:
             self.btn_retry.setVisible(True)
             self.btn_more.setVisible(False)
             return
@@ -663,21 +817,17 @@ class MainApp(QMainWindow):
         self.btn_more.setVisible(True)
 
     def _retryFailedPokemon(self):
-        
-        if not self._failed_widgets:
-            return
-        
-        failed = list(self._failed_widgets)
-        self._failed_widgets.clear()
 
-        # Reset visual error flag
-        self._connection_error_shown = False
+        # The breaker still probes with one card before the full batch
+        self.retry_queue.retry_now()
 
-        self.btn_retry.setVisible(True)
-        self.btn_more.setVisible(False)
+    def _onRetryQueueChanged(self):
 
-        for widget in failed:
-            widget.retry_loading()
+        # Every failed card loaded again: allow a new warning next time
+        if not self.retry_queue:
+            self._connection_error_shown = False
+
+        self._updateRetryAndMoreButtons()
 
     # ---------------------------------------------------
     # Pokédex – Post Load & Navigation
@@ -775,6 +925,7 @@ class MainApp(QMainWindow):
 
         # Close order menu after applying changes
         self.menu_order.close()
+        self._cancelSearch()
 
         # ----- RESOLVE ORDERING KEY -----
         if self.cb_id.isChecked():
@@ -806,6 +957,7 @@ class MainApp(QMainWindow):
     def _applyPokemonFilters(self):
 
         self.menu_filter.close()
+        self._cancelSearch()
 
         # ----- RESOLVE SELECTED TYPE FILTER -----
         selected_type = self.cb_type.currentText()
@@ -825,13 +977,22 @@ class MainApp(QMainWindow):
 
         widgets = filtered_widgets = []
 
+        # Cards still loading (or waiting for the connection) stay in the
+        # grid, hidden until they appear: out of it they would open as
+        # top-level windows when their data arrives
+        pending_widgets = []
+
         selected_type = self.active_filters.get("type_1")
 
          # ----- FILTERING STAGE -----
         for w in self._all_pokemon_widgets:
 
-            # Ignore widgets that are not fully loaded
+            # Not fully loaded: nothing to filter or order by yet
             if w.state != WidgetState.READY:
+
+                if w.parentWidget() is self.area_pokemon:
+                    pending_widgets.append(w)
+
                 continue
 
             # Apply type filter if active
@@ -858,7 +1019,7 @@ class MainApp(QMainWindow):
             return
 
         # Clear the grid visually
-        self._rebuildPokedexLayout(filtered_widgets)
+        self._rebuildPokedexLayout(filtered_widgets + pending_widgets)
 
     # ==================================================
     # Pokémon Detail Page Navigation
@@ -866,11 +1027,32 @@ class MainApp(QMainWindow):
 
     def _openPokemonApiPage(self, data: dict):
 
+        self._cancelBackfill()
         self._fillPokemonApiPage(data)
 
         index = self.pages_app.indexOf(self.page_pokemon)
         self.pages_app.slideToWidgetIndex(index)
 
+        # Some detail requests failed: retry only those in the background
+        if data.get("missing"):
+            self.backfill_loader = PokemonLoader(data["id"], FetchPriority.INTERACTIVE, FetchProfile.DETAIL, card=data)
+            self.backfill_loader.finished.connect(self._onBackfillLoaded)
+            self.backfill_loader.error.connect(self._showConnectionWarning)
+            self.backfill_loader.start()
+
+    def _cancelBackfill(self):
+
+        if self.backfill_loader:
+            self.backfill_loader.cancel()
+            self.backfill_loader = None
+
+    def _onBackfillLoaded(self, data: dict):
+
+        self._fillPokemonDetails(data, data["types"])
+
+        if data.get("missing"):
+            self._showConnectionWarning("Algunos datos del Pokémon no están disponibles por ahora.")
+
     def _fillPokemonApiPage(self, data: dict):
 
         style_manager = PokemonTypeStyle()
@@ -879,9 +1061,8 @@ class MainApp(QMainWindow):
         self.label_page_name.setText(data["name"].capitalize())
         self.label_page_id.setText(f"N° {data['id']:03d}")
 
-        # ----- Pokemon image -----
-        pixmap = QPixmap(f"resources/images_pokemon/{data['id']:03d}.png")
-        self.label_page_img.setPixmap(pixmap)
+        # ----- Pokemon image (decoded on the image pool) -----
+        self._loadPageImage(data["id"])
 
         types = data["types"]
 
@@ -900,27 +1081,14 @@ class MainApp(QMainWindow):
         else:
             self.page_type_2.hide()
 
-        # ----- Gender indicator ----
-        self.gender_indicator.apply(data["gender_ratio"])
-
         # ----- Physical attributes -----
         height_m = data["height"] / 10
         weight_kg = data["weight"] / 10
         self.label_page_height.setText(f"Altura: {height_m} metros")
         self.label_page_weight.setText(f"Peso: {weight_kg} Kg")
 
-        # ----- Abilities -----
-        apply_abilities_buttons(
-            data["abilities"],
-            self.frame_54.layout(),
-            types[0]
-        )
-
-        apply_abilities_buttons(
-            data["hidden_ability"],
-            self.frame_56.layout(),
-            types[0]
-        )
+        # ----- Detail fields (may still be missing) -----
+        self._fillPokemonDetails(data, types)
 
         # ==========================
         # Base Stats Setup
@@ -956,8 +1124,42 @@ class MainApp(QMainWindow):
 
         self.stats_animator.prepare_bar(self.bar_total, qss, 1530)
 
+    def _loadPageImage(self, pokemon_id: int):
+
+        if self.page_image_loader:
+            self.page_image_loader.cancel()
+
+        ratio = self.devicePixelRatioF()
+
+        self.label_page_img.setPixmap(placeholder_pixmap(ImageVariant.DETAIL, ratio))
+
+        self.page_image_loader = ImageLoader(pokemon_id, ImageVariant.DETAIL, ratio)
+        self.page_image_loader.finished.connect(self.label_page_img.setPixmap)
+        self.page_image_loader.start()
+
+    def _fillPokemonDetails(self, data: dict, types: list[str]):
+
+        # ----- Gender indicator ----
+        self.gender_indicator.apply(data["gender_ratio"])
+
+        # ----- Abilities -----
+        apply_abilities_buttons(
+            data["abilities"],
+            self.frame_54.layout(),
+            types[0]
+        )
+
+        apply_abilities_buttons(
+            data["hidden_ability"],
+            self.frame_56.layout(),
+            types[0]
+        )
+
         # ----- Pokemon description -----
-        self.page_description.setPlainText(get_spanish_description(data["description"]))
+        if "description" in data.get("missing", ()):
+            self.page_description.setPlainText("Descripción no disponible por ahora.")
+        else:
+            self.page_description.setPlainText(get_spanish_description(data["description"]))
 
     def _animateStatsBars(self):
 
@@ -982,6 +1184,8 @@ class MainApp(QMainWindow):
 
     def _slideToHomePokedex(self):
         
+        self._cancelSearch()
+        self._cancelBackfill()
         self.pages_app.slideToWidget(self.pokedex)
         self.page_api_pokemon.setCurrentWidget(self.show_info_basic)
 
@@ -1027,6 +1231,32 @@ class MainApp(QMainWindow):
         # Abort search if input is empty
         if not query:
             return 
+
+        # A new query supersedes any search still in flight
+        self._cancelSearch()
+
+        # ==================================================
+        # Resolve Name/ID Locally
+        # ==================================================
+
+        directory = self.fetch_service.directory
+
+        if directory:
+            pokemon_id = directory.resolve(query)
+
+            # Unknown name: answer at once instead of a 404 round-trip
+            if pokemon_id is None:
+                message = "No se encontró ningún Pokémon con ese nombre o ID"
+                suggestions = directory.suggest(query)
+
+                if suggestions:
+                    names = ", ".join(name.capitalize() for name in suggestions)
+                    message += f". ¿Quisiste decir: {names}?"
+
+                self._onSearchPokemonError(message)
+                return
+
+            query = str(pokemon_id)
         
         # ==================================================
         # Search in Already Loaded Pokémon
@@ -1034,14 +1264,18 @@ class MainApp(QMainWindow):
 
         for widget in self._getAllPokemonWidgets():
 
+            # Skip cards that are still loading or failed
+            if widget.state != WidgetState.READY:
+                continue
+
             # ----- Search by numeric ID -----
             if query.isdigit() and widget.pokemon_id == int(query):
-                self._openPokemonApiPage(widget.data)
+                widget.open_details()
                 return
 
             # ----- Search by exact Pokemon name -----
             if widget.pokemon_name.lower() == query:
-                self._openPokemonApiPage(widget.data)
+                widget.open_details()
                 return
 
         # ==================================================
@@ -1049,7 +1283,7 @@ class MainApp(QMainWindow):
         # ==================================================
 
         # Create a loader thread to fetch Pokemon data asynchronously
-        self.search_loader = PokemonLoader(query)
+        self.search_loader = PokemonLoader(query, FetchPriority.INTERACTIVE)
 
         # Connect loader signals
         self.search_loader.finished.connect(self._onSearchPokemonLoaded)
@@ -1058,6 +1292,12 @@ class MainApp(QMainWindow):
         # Start background API requests
         self.search_loader.start()
 
+    def _cancelSearch(self):
+
+        if self.search_loader:
+            self.search_loader.cancel()
+            self.search_loader = None
+
     def _onSearchPokemonLoaded(self, data: dict):
 
         # Open Pokemon detail page with fetched data
@@ -1075,10 +1315,30 @@ class MainApp(QMainWindow):
             duration=3500
         )
 
+    def _onDirectoryReady(self):
+
+        # Autocomplete Pokémon names in the search box
+        completer = QCompleter(self.fetch_service.directory.names(), self.search_pokemon)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchStartsWith)
+
+        self.search_pokemon.setCompleter(completer)
+
     def _onNumPokemonChanged(self, value: int):
 
         self._batch_size = value
 
+    def _onImageCacheChanged(self, value: int):
+
+        PixmapCache.instance().set_max_bytes(value * 1024 * 1024)
+
+    def _onPrefetchSettingsChanged(self, *args):
+
+        cfg = self.config_page.cfg
+
+        self.prefetcher.depth = cfg.prefetchDepth.value
+        self.prefetcher.budget = cfg.prefetchBudget.value
+
     # ==================================================
     # Application Navigation
     # ==================================================
@@ -1253,6 +1513,17 @@ class MainApp(QMainWindow):
     # Global Event Handling
     # ==================================================
 
+    def closeEvent(self, event):
+
+        # Abort every pending request before the window goes away
+        self._cancelSearch()
+        self.prefetcher.cancel()
+
+        for widget in self._all_pokemon_widgets:
+            widget.cancel_loading()
+
+        super().closeEvent(event)
+
     def eventFilter(self, obj, event):
 
         # ----- Pikachu image click -----
@@ -1278,6 +1549,9 @@ class MainApp(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
+    # Stop the shared fetch service (loop + session) on exit
+    app.aboutToQuit.connect(FetchService.shutdown)
+
     # Display splash screen before main window
     from structure.widgets.splash_screen import SplashScreen
     splash = SplashScreen()
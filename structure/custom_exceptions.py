@@ -8,4 +8,9 @@ class InternetConnectionError(Exception):
     pass
 
 class PokemonNotFoundError(Exception):
-    pass
\ No newline at end of file
+    pass
+
+# Exception raised when a load is cancelled before it completes
+class LoadCancelledError(Exception):
+    """Raised when a Pokémon load has been cancelled."""
+    pass
@@ -1,6 +1,14 @@
 import aiohttp
 import asyncio
 import sys
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from enum import Enum
+from structure.threads.data_sources import BASE_URL, HttpSource
+from structure.threads.decoders import decode
+from structure.threads.localized_names import LocalizedNames, resource_id
+from structure.threads.rate_limiter import AdaptiveLimiter, FetchPriority, backoff_delay, RETRY_ATTEMPTS
 from structure.custom_exceptions import InternetConnectionError
 from structure.custom_exceptions import PokemonNotFoundError
 
@@ -8,72 +16,353 @@ if sys.platform.startswith("win"):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
+# ==================================================
+# Shared Sub-resource Memo
+# ==================================================
+
+# Small, highly shared documents kept in memory between loads
+MEMO_PATTERNS = ("/type/", "/ability/")
+
+# Upper bound for memoized documents (LRU eviction)
+MEMO_MAX_ENTRIES = 512
+
+# Upper bound for the sub-resource references kept between the two record phases
+DETAIL_REFS_MAX_ENTRIES = 2048
+
+# Upper bound for detail profiles kept in memory, per Pokémon ID
+DETAILS_MAX_ENTRIES = 256
+
+# Payloads from this size on are decoded in the process pool, when enabled
+# (smaller ones are cheaper to decode than to send to a worker)
+DECODE_POOL_MIN_BYTES = 32 * 1024
+
+
+# ==================================================
+# Fetch Profiles
+# ==================================================
+
+class FetchProfile(Enum):
+    """
+    Set of record fields (and therefore requests) a load asks for.
+    """
+    CARD = 1    # /pokemon/{id}: name, id, types, size and stats
+    DETAIL = 2  # CARD + /pokemon-species/{id} and ability names
+
+
+# Fields only present in the DETAIL profile
+DETAIL_FIELDS = ("abilities", "hidden_ability", "description", "gender_ratio")
+
+# Values shown for detail fields that could not be loaded yet
+DETAIL_PLACEHOLDERS = {
+    "abilities": [],
+    "hidden_ability": [],
+    "description": [],
+    "gender_ratio": None
+}
+
+
 class APIPokemon:
-    async def fetch_data(self, session, url):
-        """Makes a GET request to a given URL and returns the JSON data."""
 
+    def __init__(self, cache=None, base_url=BASE_URL, names=None, connectivity=None, source=None, decode_pool=None):
+
+        # Where documents come from: HTTP (default) or a local api-data mirror
+        self.source = source if source is not None else HttpSource(base_url)
+        self.base_url = self.source.base_url
+
+        # Optional ConnectivityMonitor fed with every request outcome
+        self.connectivity = connectivity
+
+        # Optional persistent HttpCache checked before the network
+        self.cache = cache
+
+        # Optional ProcessPoolExecutor that keeps JSON decoding off this process' GIL
+        self.decode_pool = decode_pool
+
+        # Type and ability names by ID, so records skip those documents
+        self.names = names if names is not None else LocalizedNames()
+
+        # Global cap on requests in flight, tuned from observed responses
+        self.limiter = AdaptiveLimiter()
+
+        # URL -> running request shared by concurrent callers
+        self._in_flight = {}
+
+        # URL -> number of callers still waiting for that request
+        self._waiters = Counter()
+
+        # URL -> decoded JSON for memoizable sub-resources
+        self._memo = OrderedDict()
+
+        # URL -> background revalidation of a stale cache entry
+        self._revalidating = {}
+
+        # Pokémon ID -> (species URL, abilities, hidden abilities) for the detail phase
+        self._detail_refs = OrderedDict()
+
+        # Pokémon ID -> detail fields already built (LRU)
+        self._details = OrderedDict()
+
+    async def fetch_data(self, session, url, priority=FetchPriority.VISIBLE):
+        """Returns the JSON data for a URL, sharing in-flight requests."""
+
+        if url in self._memo:
+            self._memo.move_to_end(url)
+            return self._memo[url]
+
+        task = self._in_flight.get(url)
+
+        # First caller starts the request, the rest join it
+        if task is None:
+            task = asyncio.ensure_future(self._request(session, url, priority))
+            self._in_flight[url] = task
+            task.add_done_callback(lambda done: self._forget(url, done))
+
+        # A more urgent caller joining a queued request moves it forward
+        else:
+            self.limiter.promote(url, priority)
+
+        self._waiters[url] += 1
+
+        # Shield so a cancelled caller does not abort the shared request
         try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                
-                if response.status == 404:
-                    raise PokemonNotFoundError("Pokémon no encontrado")
-                
-                raise Exception(f"Error HTTP {response.status}")
-        
-        except aiohttp.ClientConnectionError:
-            raise InternetConnectionError("No tienes conexión a internet en estos momentos.")
+            return await asyncio.shield(task)
 
+        finally:
+            self._waiters[url] -= 1
 
-    async def fetch_pokemon(self, session, pokemon):
-        """Fetches basic data about a Pokémon """
+            # Every caller went away: abort the underlying request too
+            if self._waiters[url] <= 0:
+                del self._waiters[url]
 
-        url = f"https://pokeapi.co/api/v2/pokemon/{pokemon}/"
+                if not task.done():
+                    self._forget(url, task)
+                    task.cancel()
 
-        pokemon_data = await self.fetch_data(session, url)
-        
-        # Types
-        types_urls = [type_["type"]["url"] for type_ in pokemon_data["types"]]
-        types_tasks = [self.fetch_data(session, type_url) for type_url in types_urls]
-        types_data = await asyncio.gather(*types_tasks)
-        types = [type_data["name"] for type_data in types_data]
+    def _forget(self, url, task):
 
-        # Description
-        specie_url = pokemon_data["species"]["url"]
-        descriptions = await self.fetch_data(session, specie_url)
+        # Only drop the entry if it still belongs to this request
+        if self._in_flight.get(url) is task:
+            del self._in_flight[url]
 
-        flavor_entries = []
+    async def _request(self, session, url, priority):
+        """Makes a GET request to a given URL and returns the projected JSON data."""
 
-        for entry in descriptions["flavor_text_entries"]:
+        # Local mirror: read the file, no cache, limiter or socket involved
+        if self.source.local:
+            data = await self._decode(url, await self.source.read(url))
+            self._remember(url, data)
+            return data
 
-            flavor_entries.append({
-                "text": entry["flavor_text"].replace("\n", " ").replace("\f", " ").strip(),
-                "language": entry["language"]["name"]
-            })
+        entry = await self._cache_io(self.cache.get, url) if self.cache else None
 
+        # Fresh cached copy: no network round-trip at all
+        if entry and self.cache.is_fresh(entry):
+            data = await self._decode(url, entry.body)
+            self._remember(url, data)
+            return data
 
-        # Gender
-        gender_task = self.fetch_data(session, specie_url)
-        gender = await asyncio.gather(gender_task)
+        # Stale cached copy: serve it now, revalidate in the background
+        if entry:
+            data = await self._decode(url, entry.body)
+            self._remember(url, data)
+            self._schedule_revalidation(session, url, entry)
+            return data
 
-        # Stats base
-        stats_task = self.fetch_data(session, url)
-        stats = await asyncio.gather(stats_task)
-        stats_dict = {stat["stat"]["name"]: stat["base_stat"] for stat in stats[0]["stats"]}
+        status, body, response_headers = await self._download(session, url, {}, priority)
+
+        if status == 200:
+
+            if self.cache:
+                await self._cache_io(
+                    self.cache.put,
+                    url,
+                    body,
+                    response_headers.get("ETag"),
+                    response_headers.get("Last-Modified")
+                )
+
+            data = await self._decode(url, body)
+            self._remember(url, data)
+            return data
+
+        if status == 404:
+            raise PokemonNotFoundError("Pokémon no encontrado")
+
+        raise Exception(f"Error HTTP {status}")
+
+    async def _cache_io(self, method, *args):
+        """Runs an HttpCache method on the cache thread, never on this loop."""
+        return await asyncio.get_running_loop().run_in_executor(self.cache.executor, method, *args)
+
+    async def _decode(self, url, body):
+        """Projected JSON for a payload, decoded in a worker process if it is large."""
+
+        if self.decode_pool and len(body) >= DECODE_POOL_MIN_BYTES:
+
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.decode_pool, decode, url, body)
+
+            # A worker died: keep decoding in this process from now on
+            except BrokenProcessPool:
+                self.decode_pool = None
+
+        return decode(url, body)
+
+    def _schedule_revalidation(self, session, url, entry):
+
+        if url in self._revalidating:
+            return
+
+        task = asyncio.ensure_future(self._revalidate(session, url, entry))
+        self._revalidating[url] = task
+        task.add_done_callback(lambda done: self._revalidating.pop(url, None))
+
+    async def _revalidate(self, session, url, entry):
+        """Conditional GET for a stale entry, retried until it gets an answer."""
+
+        headers = {}
+
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        while True:
+
+            # Offline: wait for the connection instead of failing
+            if self.connectivity:
+                await self.connectivity.wait_online()
+
+            try:
+                status, body, response_headers = await self._download(session, url, headers, FetchPriority.PREFETCH)
+
+            except InternetConnectionError:
+
+                # Without a monitor there is no way to know when to retry
+                if not self.connectivity:
+                    return
+
+                continue
+
+            break
+
+        if status == 304:
+            await self._cache_io(self.cache.refresh, url)
+
+        elif status == 200:
+            await self._cache_io(self.cache.put, url, body, response_headers.get("ETag"), response_headers.get("Last-Modified"))
+
+            # Later loads see the new document
+            self._memo.pop(url, None)
+
+    async def _download(self, session, url, headers, priority):
+        """GET under the adaptive limiter, retrying throttled or failed attempts."""
+
+        last_attempt = RETRY_ATTEMPTS - 1
+        attempt = 0
+
+        while True:
+
+            retry_after = None
+
+            # Offline: hold the request until the connection comes back
+            # (cancelling the load still aborts the wait)
+            if self.connectivity:
+                await self.connectivity.wait_online()
 
-        # Abilities
+            try:
+                async with self.limiter.slot(priority, key=url):
+                    started = time.monotonic()
 
-        hidden_abilities_urls = [
-            ability["ability"]["url"] for ability in pokemon_data["abilities"] if ability["is_hidden"]
-        ]
+                    async with session.get(url, headers=headers) as response:
+                        status = response.status
+                        body = await response.read()
 
-        hidden_abilities_tasks = [self.fetch_data(session, hidden_ability_url) for hidden_ability_url in hidden_abilities_urls]
-        hidden_abilities = await asyncio.gather(*hidden_abilities_tasks)
+                        # Any answer, even an error, proves the API is reachable
+                        if self.connectivity:
+                            self.connectivity.report_success()
 
-        abilities_urls = [abilitie["ability"]["url"] for abilitie in pokemon_data["abilities"] if abilitie["is_hidden"] == False]
-        ability_tasks = [self.fetch_data(session, ability_url) for ability_url in abilities_urls]
-        abilities = await asyncio.gather(*ability_tasks)
+                        # Throttled or server error: shrink the cap and retry
+                        if status == 429 or status >= 500:
+                            self.limiter.record_throttle()
+                            retry_after = response.headers.get("Retry-After")
+
+                        else:
+                            self.limiter.record_success(time.monotonic() - started)
+                            return status, body, response.headers
+
+                if attempt == last_attempt:
+                    return status, body, response.headers
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+
+                if self.connectivity:
+                    self.connectivity.report_failure()
+
+                    # Went offline: pause at the top of the loop, this attempt does not count
+                    if not self.connectivity.online:
+                        continue
+
+                if attempt == last_attempt:
+                    raise InternetConnectionError("No tienes conexión a internet en estos momentos.")
+
+            # Wait outside the slot so other requests can use it
+            await asyncio.sleep(backoff_delay(attempt, retry_after))
+            attempt += 1
+
+    def _remember(self, url, data):
+
+        if not any(pattern in url for pattern in MEMO_PATTERNS):
+            return
+
+        self._memo[url] = data
+        self._memo.move_to_end(url)
+
+        while len(self._memo) > MEMO_MAX_ENTRIES:
+            self._memo.popitem(last=False)
+
+
+    async def _localized_name(self, session, kind, ref, priority):
+        """Localized name of a type/ability, downloading it only when unknown."""
+
+        id_ = resource_id(ref["url"])
+        name = self.names.get(kind, id_)
+
+        if name is None:
+            self.names.add(kind, id_, await self.fetch_data(session, ref["url"], priority))
+            name = self.names.get(kind, id_)
+
+        return name or ref["name"]
+
+    # ==================================================
+    # Pokémon Records
+    # ==================================================
+    #
+    # A record is built in two phases matching the fetch profiles: the
+    # card fields come from the /pokemon/{id} document alone, the detail
+    # fields need the species document and the ability names on top.
+
+    async def fetch_card(self, session, pokemon, priority=FetchPriority.VISIBLE, token=None):
+        """Fetches the fields shown on a Pokédex card (one request)."""
+
+        url = f"{self.base_url}/pokemon/{pokemon}/"
+
+        pokemon_data = await self.fetch_data(session, url, priority)
+
+        # Stop before the sub-requests if the load was cancelled meanwhile
+        if token:
+            token.raise_if_cancelled()
+
+        types = await asyncio.gather(*[
+            self._localized_name(session, "type", type_["type"], priority) for type_ in pokemon_data["types"]
+        ])
+
+        # Kept for the detail phase so it does not need this document again
+        self._remember_refs(pokemon_data)
+
+        # Stats base
+        stats_dict = {stat["stat"]["name"]: stat["base_stat"] for stat in pokemon_data["stats"]}
 
         return {
 
@@ -81,12 +370,116 @@ class APIPokemon:
             "id": pokemon_data["id"],
             "height": pokemon_data["height"],
             "weight": pokemon_data["weight"],
-            "types": [type_url["names"][5]["name"].lower() for type_url in types_data],
-            "abilities": [ability["names"][5]["name"] for ability in abilities],
-            "hidden_ability": [hidden_ability["names"][5]["name"] for hidden_ability in hidden_abilities],
-            "description": flavor_entries,
-            "gender_ratio": gender[0]["gender_rate"],
+            "types": [type_.lower() for type_ in types],
             "base_stats": stats_dict
         }
-    
 
+    async def fetch_details(self, session, pokemon_id, priority=FetchPriority.VISIBLE, token=None):
+        """
+        Fetches the detail-page fields of a Pokémon (species + abilities).
+
+        Fields whose sub-requests failed are listed in "missing" and keep
+        a placeholder value; the next call only retries those requests.
+        """
+
+        cached = self._details.get(pokemon_id)
+
+        if cached is not None:
+            self._details.move_to_end(pokemon_id)
+
+            if not cached["missing"]:
+                return cached
+
+        refs = self._detail_refs.get(pokemon_id)
+
+        if refs is None:
+            pokemon_data = await self.fetch_data(session, f"{self.base_url}/pokemon/{pokemon_id}/", priority)
+            refs = self._remember_refs(pokemon_data)
+
+            if token:
+                token.raise_if_cancelled()
+
+        specie_url, abilities_refs, hidden_abilities_refs = refs
+
+        details = dict(cached) if cached else {**DETAIL_PLACEHOLDERS, "missing": list(DETAIL_FIELDS)}
+        missing = set(details["missing"])
+
+        # Only the sub-requests behind missing fields are (re)issued
+        parts = []
+
+        if "abilities" in missing:
+            parts.append(self._ability_names(session, "abilities", abilities_refs, priority))
+
+        if "hidden_ability" in missing:
+            parts.append(self._ability_names(session, "hidden_ability", hidden_abilities_refs, priority))
+
+        if "description" in missing or "gender_ratio" in missing:
+            parts.append(self._species_fields(session, specie_url, priority))
+
+        results = await asyncio.gather(*parts, return_exceptions=True)
+
+        if token:
+            token.raise_if_cancelled()
+
+        failures = [result for result in results if isinstance(result, BaseException)]
+
+        for result in results:
+            if not isinstance(result, BaseException):
+                details.update(result)
+                missing.difference_update(result)
+
+        # Nothing could be loaded: report the error instead of an empty record
+        if failures and len(failures) == len(results) and cached is None:
+            raise failures[0]
+
+        details["missing"] = [field for field in DETAIL_FIELDS if field in missing]
+
+        self._details[pokemon_id] = details
+
+        while len(self._details) > DETAILS_MAX_ENTRIES:
+            self._details.popitem(last=False)
+
+        return details
+
+    async def _ability_names(self, session, field, refs, priority):
+
+        names = await asyncio.gather(*[self._localized_name(session, "ability", ref, priority) for ref in refs])
+
+        return {field: list(names)}
+
+    async def _species_fields(self, session, specie_url, priority):
+
+        specie_data = await self.fetch_data(session, specie_url, priority)
+
+        return {
+            "description": specie_data["description"],
+            "gender_ratio": specie_data["gender_rate"]
+        }
+
+    async def fetch_pokemon(self, session, pokemon, priority=FetchPriority.VISIBLE, token=None):
+        """Fetches the full record of a Pokémon (card + detail fields)."""
+
+        record = await self.fetch_card(session, pokemon, priority, token)
+
+        if token:
+            token.raise_if_cancelled()
+
+        record.update(await self.fetch_details(session, record["id"], priority, token))
+
+        return record
+
+    def _remember_refs(self, pokemon_data):
+
+        refs = (
+            pokemon_data["species"]["url"],
+            [ability["ability"] for ability in pokemon_data["abilities"] if not ability["is_hidden"]],
+            [ability["ability"] for ability in pokemon_data["abilities"] if ability["is_hidden"]]
+        )
+
+        self._detail_refs[pokemon_data["id"]] = refs
+        self._detail_refs.move_to_end(pokemon_data["id"])
+
+        while len(self._detail_refs) > DETAIL_REFS_MAX_ENTRIES:
+            self._detail_refs.popitem(last=False)
+
+        return refs
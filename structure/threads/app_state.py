@@ -1,17 +1,150 @@
-from enum import Enum, auto
-import socket
+from PyQt5.QtCore import QObject, pyqtSignal
+from urllib.parse import urlparse
+import asyncio
 
-class ConnectionManager:
 
-    @staticmethod
-    def has_internet(timeout: float = 2.0) -> bool:
+# ==================================================
+# Connectivity Configuration
+# ==================================================
+
+# Time allowed for a probe to open a TCP connection (seconds)
+PROBE_TIMEOUT = 3.0
+
+# Probe interval while offline, doubling up to the maximum (seconds)
+PROBE_INTERVAL_MIN = 2.0
+PROBE_INTERVAL_MAX = 60.0
+
+# Consecutive connection failures before going offline
+FAILURE_THRESHOLD = 2
+
+
+# ==================================================
+# Connectivity Monitor
+# ==================================================
+
+class ConnectivityMonitor(QObject):
+    """
+    Keeps a cached online/offline state inferred from real fetch
+    outcomes, confirmed with cheap async TCP probes to the API host.
+    Every method except the signal runs on the FetchService loop.
+    """
+
+    # Emitted with the new state (True = online)
+    stateChanged = pyqtSignal(bool)
+
+    def __init__(self, url: str):
+        super().__init__()
+
+        self.url = url
+
+        # Optimistic until a fetch or a probe says otherwise
+        self.online = True
+
+        self._failures = 0
+        self._online_event = None
+        self._probe_task = None
+
+    def start(self):
+        """Binds to the running loop and checks the connection once."""
+
+        self._online_event = asyncio.Event()
+        self._online_event.set()
+
+        asyncio.ensure_future(self.check())
+
+    # ==================================================
+    # Fetch Outcomes
+    # ==================================================
+
+    def report_success(self):
+
+        self._failures = 0
+        self._set_online(True)
+
+    def report_failure(self):
+
+        self._failures += 1
+
+        if self._failures >= FAILURE_THRESHOLD:
+            self._set_online(False)
+
+    async def wait_online(self, timeout: float | None = None) -> bool:
+        """
+        Waits until online (by default for as long as it takes, the
+        caller's cancellation still applies), returns the resulting state.
+        """
+
+        if self.online or self._online_event is None:
+            return self.online
 
         try:
-            socket.setdefaulttimeout(timeout)
-            socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect(("8.8.8.8", 53))
+            await asyncio.wait_for(self._online_event.wait(), timeout)
+
+        except asyncio.TimeoutError:
+            pass
+
+        return self.online
+
+    # ==================================================
+    # Probes
+    # ==================================================
+
+    async def probe(self) -> bool:
+        """Opens (and closes) a TCP connection to the API host."""
+
+        parsed = urlparse(self.url)
+
+        # Local data sources are always reachable
+        if not parsed.hostname:
             return True
-        
-        except OSError:
+
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(parsed.hostname, port), PROBE_TIMEOUT)
+
+        except (OSError, asyncio.TimeoutError):
             return False
-        
-    
\ No newline at end of file
+
+        writer.close()
+        return True
+
+    async def check(self) -> bool:
+
+        online = await self.probe()
+
+        if online:
+            self._failures = 0
+
+        self._set_online(online)
+        return online
+
+    async def _probe_until_online(self):
+
+        delay = PROBE_INTERVAL_MIN
+
+        while not self.online:
+            await asyncio.sleep(delay)
+
+            if await self.probe():
+                self.report_success()
+
+            delay = min(PROBE_INTERVAL_MAX, delay * 2)
+
+    def _set_online(self, online: bool):
+
+        if online == self.online:
+            return
+
+        self.online = online
+
+        if online:
+            self._online_event.set()
+
+        else:
+            self._online_event.clear()
+
+            if self._probe_task is None or self._probe_task.done():
+                self._probe_task = asyncio.ensure_future(self._probe_until_online())
+
+        self.stateChanged.emit(online)
@@ -0,0 +1,50 @@
+import threading
+from structure.custom_exceptions import LoadCancelledError
+
+
+# ==================================================
+# Cancellation Token
+# ==================================================
+
+class CancelToken:
+    """
+    Thread-safe cancellation flag shared between a loader in the
+    GUI thread and the requests it runs on the fetch service loop.
+    """
+
+    def __init__(self):
+
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+
+        with self._lock:
+            if self._cancelled:
+                return
+
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback):
+        """Runs callback on cancellation (immediately if already cancelled)."""
+
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+
+        callback()
+
+    def raise_if_cancelled(self):
+
+        if self._cancelled:
+            raise LoadCancelledError("Carga cancelada")
@@ -0,0 +1,127 @@
+from pathlib import Path
+from urllib.parse import urlparse
+import asyncio
+import json
+
+from structure.custom_exceptions import PokemonNotFoundError
+
+
+# ==================================================
+# Data Source Configuration
+# ==================================================
+
+# Root of the PokeAPI v2 REST endpoints
+BASE_URL = "https://pokeapi.co/api/v2"
+
+# Path prefix of every resource inside the api-data tree
+MIRROR_PREFIX = "/api/v2"
+
+# Names accepted by create_source (and stored in config.json)
+SOURCE_HTTP = "http"
+SOURCE_MIRROR = "mirror"
+
+
+# ==================================================
+# HTTP Source
+# ==================================================
+
+class HttpSource:
+    """
+    PokeAPI (or a compatible server) reached over HTTP.
+    """
+
+    local = False
+
+    def __init__(self, base_url: str = BASE_URL):
+        self.base_url = base_url.rstrip("/")
+
+
+# ==================================================
+# Filesystem Mirror Source
+# ==================================================
+
+class MirrorSource:
+    """
+    Local copy of the static PokeAPI dataset (api-data). Resource
+    URLs map to <root>/api/v2/<resource>/<id>/index.json and are read
+    on the default thread pool, no socket is ever opened. api-data only
+    has numeric folders, so names are looked up in the resource list.
+    """
+
+    local = True
+
+    # api-data documents link each other with relative URLs
+    base_url = MIRROR_PREFIX
+
+    def __init__(self, root: str | Path):
+
+        root = Path(root)
+
+        # Accept both the api-data "data" folder and the folder with api/v2 in it
+        self.root = root / "api" / "v2" if (root / "api" / "v2").is_dir() else root
+
+        # Resource kind -> name -> ID, read from the resource list on first use
+        self._ids = {}
+
+    def resolve(self, url: str) -> Path:
+        """File holding the document of a PokeAPI URL (absolute or relative)."""
+
+        path = urlparse(url).path
+
+        if MIRROR_PREFIX in path:
+            path = path.split(MIRROR_PREFIX, 1)[1]
+
+        segments = path.strip("/").split("/")
+
+        # Names are looked up, so search works before the directory is built
+        if len(segments) == 2 and not segments[1].isdigit():
+            segments[1] = str(self._resource_id(segments[0], segments[1]))
+
+        return self._inside_root(self.root.joinpath(*segments, "index.json"))
+
+    def _resource_id(self, kind: str, name: str) -> int:
+
+        if kind not in self._ids:
+            listing = json.loads(self._inside_root(self.root / kind / "index.json").read_bytes())
+
+            self._ids[kind] = {
+                result["name"]: int(result["url"].rstrip("/").rsplit("/", 1)[-1])
+                for result in listing["results"]
+            }
+
+        if name not in self._ids[kind]:
+            raise PokemonNotFoundError("Pokémon no encontrado")
+
+        return self._ids[kind][name]
+
+    def _inside_root(self, path: Path) -> Path:
+
+        # Queries like "../../x" must never read files outside the mirror
+        path = path.resolve()
+
+        if not path.is_relative_to(self.root.resolve()):
+            raise PokemonNotFoundError("Pokémon no encontrado")
+
+        return path
+
+    def _read(self, url: str) -> bytes:
+
+        try:
+            return self.resolve(url).read_bytes()
+
+        except FileNotFoundError:
+            raise PokemonNotFoundError("Pokémon no encontrado")
+
+    async def read(self, url: str) -> bytes:
+
+        # Name lookups read the resource list: the whole read runs off the loop
+        return await asyncio.get_running_loop().run_in_executor(None, self._read, url)
+
+
+def create_source(kind: str, base_url: str = BASE_URL, mirror_path: str = ""):
+    """Builds the data source selected in the configuration."""
+
+    if kind == SOURCE_MIRROR and mirror_path:
+        return MirrorSource(mirror_path)
+
+    return HttpSource(base_url or BASE_URL)
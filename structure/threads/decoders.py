@@ -0,0 +1,105 @@
+import json
+
+# Optional faster parser, the standard library one is the fallback
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+
+# ==================================================
+# Decoding Configuration
+# ==================================================
+
+# Language of the flavor texts kept in Pokémon records
+LANGUAGE = "es"
+
+# Top-level fields of each payload used by APIPokemon
+POKEMON_FIELDS = ("id", "name", "height", "weight", "types", "abilities", "species", "stats")
+NAMES_FIELDS = ("id", "name", "names")
+LISTING_FIELDS = ("count", "results")
+
+
+# ==================================================
+# Field-projected Decoders
+# ==================================================
+#
+# Parsing holds the GIL, so the decoders keep it as short as possible:
+# one C-level parse (orjson when installed, else json.loads), then a
+# projection of the few fields the records use. An object_hook to drop
+# sub-trees while parsing costs a Python call per JSON object and was
+# slower than parsing everything.
+#
+# The decoders are module-level functions so APIPokemon can run
+# them in a worker process (see DECODE_POOL_MIN_BYTES).
+
+def loads(body: bytes):
+    return orjson.loads(body) if orjson else json.loads(body)
+
+
+def decode_pokemon(body: bytes) -> dict:
+    """Decodes a /pokemon/{id} payload keeping only record fields."""
+
+    data = loads(body)
+
+    return {field: data[field] for field in POKEMON_FIELDS}
+
+
+def decode_species(body: bytes, language: str = LANGUAGE) -> dict:
+    """Decodes a /pokemon-species/{id} payload into normalized descriptions in one language."""
+
+    data = loads(body)
+    entries = data["flavor_text_entries"]
+
+    # First flavor text, used when the wanted language is missing
+    wanted = [entry for entry in entries if entry["language"]["name"] == language] or entries[:1]
+
+    # Normalized here so a worker process only sends back the record fields
+    description = [
+        {
+            "text": entry["flavor_text"].replace("\n", " ").replace("\f", " ").strip(),
+            "language": entry["language"]["name"]
+        }
+        for entry in wanted
+    ]
+
+    return {
+        "id": data["id"],
+        "gender_rate": data["gender_rate"],
+        "description": description
+    }
+
+
+def decode_names(body: bytes) -> dict:
+    """Decodes a /type/{id} or /ability/{id} payload keeping only names."""
+
+    data = loads(body)
+
+    return {field: data[field] for field in NAMES_FIELDS}
+
+
+def decode_listing(body: bytes) -> dict:
+    """Decodes a paginated list payload keeping only its results."""
+
+    data = loads(body)
+
+    return {field: data[field] for field in LISTING_FIELDS}
+
+
+def decode(url: str, body: bytes) -> dict:
+    """Picks the projected decoder that matches a PokeAPI URL."""
+
+    if "?limit=" in url:
+        return decode_listing(body)
+
+    if "/pokemon-species/" in url:
+        return decode_species(body)
+
+    if "/pokemon/" in url:
+        return decode_pokemon(body)
+
+    if "/type/" in url or "/ability/" in url:
+        return decode_names(body)
+
+    return loads(body)
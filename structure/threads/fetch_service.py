@@ -0,0 +1,249 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import multiprocessing
+import threading
+import aiohttp
+
+from structure.threads.api_pokemon import APIPokemon
+from structure.threads.app_state import ConnectivityMonitor
+from structure.threads.data_sources import HttpSource
+from structure.threads.http_cache import HttpCache
+from structure.threads.pokedex_snapshot import PokedexSnapshot
+from structure.threads.pokemon_directory import PokemonDirectory
+
+
+# ==================================================
+# Network Configuration
+# ==================================================
+
+# Maximum number of pooled connections kept open to PokeAPI
+MAX_CONNECTIONS = 10
+
+# Total time allowed for a single HTTP request (seconds)
+REQUEST_TIMEOUT = 20
+
+# Worker processes used for JSON decoding when enabled
+DECODE_WORKERS = 2
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Pooled session used for all PokeAPI traffic (call inside a loop)."""
+
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        ttl_dns_cache=300
+    )
+
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    )
+
+
+# ==================================================
+# Fetch Service Thread
+# ==================================================
+
+class FetchService(QThread):
+    """
+    Long-lived background thread that owns one asyncio event loop
+    and one pooled aiohttp session shared by every Pokémon load.
+    """
+
+    # Emitted when the name/ID directory becomes available
+    directoryReady = pyqtSignal()
+
+    _instance = None
+
+    # Data source and decoding mode used by the next instance (see configure)
+    _source = None
+    _decode_in_process = False
+
+    def __init__(self):
+        super().__init__()
+
+        self.source = FetchService._source or HttpSource()
+        self.decode_pool = None
+
+        self.loop = None
+        self.session = None
+        self.api = None
+        self.snapshot = None
+        self.directory = None
+
+        # Background work started with the loop (directory, missing names)
+        self.startup_tasks = []
+
+        # Online/offline state shared with the GUI (lives in the GUI thread)
+        self.connectivity = ConnectivityMonitor(self.source.base_url)
+
+        # Set once the event loop and the session are ready (or failed to be)
+        self._ready = threading.Event()
+        self._startup_error = None
+
+
+    # ==================================================
+    # Singleton Access
+    # ==================================================
+
+    @classmethod
+    def instance(cls) -> "FetchService":
+
+        # Start the service lazily on first use
+        if cls._instance is None:
+            service = cls()
+            service.start()
+            service._ready.wait()
+
+            # Startup failed: report it instead of handing out a dead service
+            if service._startup_error is not None:
+                service.wait()
+                raise service._startup_error
+
+            cls._instance = service
+
+        return cls._instance
+
+    @classmethod
+    def configure(cls, source, decode_in_process: bool = False):
+        """
+        Sets the data source (HttpSource or MirrorSource) and whether large
+        payloads are decoded in worker processes, before first use.
+        """
+        cls._source = source
+        cls._decode_in_process = decode_in_process
+
+    @classmethod
+    def shutdown(cls):
+
+        if cls._instance is None:
+            return
+
+        cls._instance.stop()
+        cls._instance = None
+
+
+    # ==================================================
+    # Thread Execution Logic
+    # ==================================================
+
+    def run(self):
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        try:
+            try:
+                self.loop.run_until_complete(self._open_session())
+
+            except Exception as e:
+                self._startup_error = e
+                return
+
+            # Never leave instance() waiting, whatever happened above
+            finally:
+                self._ready.set()
+
+            # Name/ID directory, and the names the shipped table lacks
+            # (fetched once and persisted), both in the background
+            self.startup_tasks = [
+                self.loop.create_task(self._load_directory()),
+                self.loop.create_task(self.api.names.complete(self.api, self.session))
+            ]
+
+            # Serve submitted work until stop() is requested
+            self.loop.run_forever()
+
+        finally:
+            self.loop.run_until_complete(self._close_session())
+            self.loop.close()
+
+    async def _open_session(self):
+
+        # Spawned (not forked) workers: this process already runs Qt threads
+        if FetchService._decode_in_process:
+            self.decode_pool = ProcessPoolExecutor(
+                max_workers=DECODE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+        # Responses on disk are checked before touching the network
+        self.api = APIPokemon(
+            cache=HttpCache(),
+            connectivity=self.connectivity,
+            source=self.source,
+            decode_pool=self.decode_pool
+        )
+
+        # First connectivity check runs in the background
+        self.connectivity.start()
+
+        # Offline Pokédex snapshot (None when not built yet)
+        self.snapshot = PokedexSnapshot.open()
+
+        self.session = create_session()
+
+    async def _load_directory(self):
+
+        self.directory = await self.loop.run_in_executor(None, PokemonDirectory.load)
+
+        if self.directory:
+            self.directoryReady.emit()
+
+            if not self.directory.is_stale:
+                return
+
+        # Build (or refresh) the directory from the species list
+        try:
+            self.directory = await PokemonDirectory.fetch(self.api, self.session)
+
+        except Exception:
+            return
+
+        self.directoryReady.emit()
+
+    async def _close_session(self):
+
+        # Cancel pending loads before closing the shared session
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks(self.loop) if task is not current]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self.session:
+            await self.session.close()
+
+        if self.api and self.api.cache:
+            self.api.cache.close()
+
+        if self.api:
+            self.api.names.save()
+
+        if self.snapshot:
+            self.snapshot.close()
+
+        if self.decode_pool:
+            self.decode_pool.shutdown(wait=False, cancel_futures=True)
+
+
+    # ==================================================
+    # Public API
+    # ==================================================
+
+    def submit(self, coro):
+        """
+        Schedules a coroutine on the service loop from any thread.
+        Returns a concurrent.futures.Future.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+
+        if self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+        self.wait()
@@ -0,0 +1,195 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sqlite3
+import time
+
+
+# ==================================================
+# Cache Configuration
+# ==================================================
+
+# SQLite database holding the raw PokeAPI responses
+CACHE_PATH = Path("cache/http_cache.sqlite3")
+
+# Responses younger than this are served without revalidation (seconds)
+CACHE_TTL = 30 * 24 * 60 * 60
+
+# Total body size kept on disk before LRU eviction (bytes)
+CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+# ==================================================
+# Cache Entry
+# ==================================================
+
+CacheEntry = namedtuple(
+    "CacheEntry",
+    ["url", "body", "etag", "last_modified", "stored_at"]
+)
+
+
+# ==================================================
+# Persistent HTTP Cache
+# ==================================================
+
+class HttpCache:
+    """
+    On-disk cache of PokeAPI responses keyed by URL, with TTL,
+    a size budget with LRU eviction and validators for revalidation.
+
+    Lookups never write: access times are buffered and flushed with
+    the next write. Async code must go through `executor`, its single
+    thread keeps SQLite work (and commits) off the event loop.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, ttl: float = CACHE_TTL, max_bytes: int = CACHE_MAX_BYTES):
+
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Every call from the fetch loop runs here, one at a time
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="http-cache")
+
+        # URL -> last access time not written to disk yet
+        self._accessed = {}
+
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+        self._db.commit()
+
+        # Running total to avoid a SUM() on every write
+        self._total_bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+
+    # ==================================================
+    # Lookup
+    # ==================================================
+
+    def get(self, url: str) -> CacheEntry | None:
+
+        row = self._db.execute(
+            "SELECT url, body, etag, last_modified, stored_at FROM responses WHERE url = ?",
+            (url,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self._accessed[url] = time.time()
+
+        return CacheEntry(*row)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.stored_at < self.ttl
+
+
+    # ==================================================
+    # Storage
+    # ==================================================
+
+    def put(self, url: str, body: bytes, etag: str | None = None, last_modified: str | None = None):
+
+        now = time.time()
+
+        previous = self._db.execute(
+            "SELECT size FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+
+        if previous:
+            self._total_bytes -= previous[0]
+
+        # Eviction below must see the recent hits
+        self._write_access_times()
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, body, etag, last_modified, now, now, len(body))
+        )
+        self._total_bytes += len(body)
+
+        self._evict()
+        self._db.commit()
+
+    def refresh(self, url: str):
+        """Marks an entry as fresh again after a 304 Not Modified."""
+
+        now = time.time()
+
+        self._accessed.pop(url, None)
+        self._write_access_times()
+
+        self._db.execute(
+            "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+            (now, now, url)
+        )
+        self._db.commit()
+
+    def flush(self):
+        """Writes the buffered access times."""
+
+        self._write_access_times()
+        self._db.commit()
+
+    def _write_access_times(self):
+
+        if not self._accessed:
+            return
+
+        accessed, self._accessed = self._accessed, {}
+
+        self._db.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE url = ?",
+            [(accessed_at, url) for url, accessed_at in accessed.items()]
+        )
+
+
+    # ==================================================
+    # Eviction & Cleanup
+    # ==================================================
+
+    def _evict(self):
+
+        # Drop least recently used responses until under budget
+        while self._total_bytes > self.max_bytes:
+
+            rows = self._db.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at LIMIT 32"
+            ).fetchall()
+
+            if not rows:
+                self._total_bytes = 0
+                return
+
+            for url, size in rows:
+                self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._total_bytes -= size
+
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def close(self):
+
+        # Let queued calls finish before the connection goes away
+        self.executor.shutdown(wait=True)
+
+        self.flush()
+        self._db.close()
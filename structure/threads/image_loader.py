@@ -0,0 +1,197 @@
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPainter, QIcon
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, pyqtSignal
+
+from structure.threads.thumbnail_cache import ImageVariant, SOURCE_SIZE, thumbnails
+from structure.threads.pixmap_cache import PixmapCache
+from structure.threads.image_pack import ImagePack
+
+
+# ==================================================
+# Image Loader Configuration
+# ==================================================
+
+# Worker threads decoding images (disk reads and PNG inflation)
+IMAGE_WORKERS = 2
+
+# Icon drawn, small and centered, while the real image decodes
+PLACEHOLDER_ICON = "resources/icons/menu/desactivate/pokedex_desactivate.svg"
+PLACEHOLDER_ICON_SIZE = 40
+
+
+def decode_image(pokemon_id: int, variant: ImageVariant, ratio: float = 1.0, pack: ImagePack | None = None) -> QImage:
+    """
+    Decodes a Pokémon image at the pixel size of a variant, from the
+    image pack when it has the Pokémon, else from the loose files.
+    Safe on any thread: it only touches QImage, never QPixmap.
+    """
+
+    size = min(thumbnails.pixel_size(variant, ratio), SOURCE_SIZE)
+
+    image = pack.image(pokemon_id, size) if pack else None
+
+    if image is None:
+        reader = QImageReader(str(thumbnails.path(pokemon_id, variant, ratio)))
+        reader.setScaledSize(QSize(size, size))
+
+        image = reader.read()
+
+    if image.isNull():
+        return image
+
+    # Packs built for other pixel ratios may hold a larger image only
+    if image.width() > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    # Native format: QPixmap.fromImage is then a plain copy
+    image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(max(1.0, image.width() / variant.value))
+
+    return image
+
+
+_placeholders = {}
+
+
+def placeholder_pixmap(variant: ImageVariant, ratio: float = 1.0) -> QPixmap:
+    """Transparent pixmap of the variant size with a small icon in the middle."""
+
+    key = (variant, ratio)
+
+    if key not in _placeholders:
+        size = thumbnails.pixel_size(variant, ratio)
+        icon_size = round(PLACEHOLDER_ICON_SIZE * ratio)
+
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setOpacity(0.35)
+        painter.drawPixmap(
+            (size - icon_size) // 2,
+            (size - icon_size) // 2,
+            QIcon(PLACEHOLDER_ICON).pixmap(icon_size, icon_size)
+        )
+        painter.end()
+
+        pixmap.setDevicePixelRatio(ratio)
+        _placeholders[key] = pixmap
+
+    return _placeholders[key]
+
+
+# ==================================================
+# Decode Pool & Image Pack
+# ==================================================
+
+_pool = None
+
+# Opened once, on the first load; False when there is no usable pack
+_pack = None
+
+
+def image_pool() -> QThreadPool:
+    """Thread pool shared by every image load."""
+
+    global _pool
+
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(IMAGE_WORKERS)
+
+    return _pool
+
+
+def image_pack() -> ImagePack | None:
+    """Memory-mapped image pack, or None to use the loose files."""
+
+    global _pack
+
+    if _pack is None:
+        _pack = ImagePack.open() or False
+
+    return _pack or None
+
+
+class _DecodeTask(QRunnable):
+
+    def __init__(self, loader, pack):
+        super().__init__()
+        self.loader = loader
+        self.pack = pack
+
+    def run(self):
+
+        loader = self.loader
+
+        # Cancelled while queued: skip the disk read entirely
+        if loader.cancelled:
+            return
+
+        # An exception escaping a QRunnable aborts the whole app (qFatal):
+        # any failure becomes a null image, which the loader drops
+        try:
+            image = decode_image(loader.pokemon_id, loader.variant, loader.ratio, self.pack)
+
+        except Exception:
+            image = QImage()
+
+        # Queued to the GUI thread, where the loader lives
+        loader._decoded.emit(image)
+
+
+# ==================================================
+# Image Loader
+# ==================================================
+
+class ImageLoader(QObject):
+    """
+    Decodes one Pokémon image on the image pool and hands it to the
+    GUI thread as a QPixmap, the only step that must run there.
+    Images already in the shared PixmapCache are delivered at once.
+    """
+
+    finished = pyqtSignal(QPixmap)
+
+    # Decoded image from a worker thread, converted in the GUI thread
+    _decoded = pyqtSignal(QImage)
+
+    def __init__(self, pokemon_id: int, variant: ImageVariant, ratio: float = 1.0):
+        super().__init__()
+
+        self.pokemon_id = pokemon_id
+        self.variant = variant
+        self.ratio = ratio
+
+        self.cancelled = False
+
+        self._decoded.connect(self._deliver)
+
+    @property
+    def key(self) -> tuple:
+        return (self.pokemon_id, self.variant, self.ratio)
+
+    def start(self):
+
+        pixmap = PixmapCache.instance().get(self.key)
+
+        # Seen before: no disk access, no placeholder flash
+        if pixmap is not None:
+            self.finished.emit(pixmap)
+            return
+
+        # The pack is opened here, on the GUI thread, before any worker needs it
+        image_pool().start(_DecodeTask(self, image_pack()))
+
+    def cancel(self):
+        self.cancelled = True
+
+    def _deliver(self, image: QImage):
+
+        # Results that arrive after cancel() are stale and dropped
+        if self.cancelled or image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        PixmapCache.instance().put(self.key, pixmap)
+
+        self.finished.emit(pixmap)
@@ -0,0 +1,225 @@
+from PyQt5.QtGui import QImage
+from pathlib import Path
+import argparse
+import bisect
+import mmap
+import struct
+import time
+
+from structure.threads.thumbnail_cache import (
+    IMAGES_PATH,
+    SOURCE_SIZE,
+    ImageVariant,
+    ThumbnailCache,
+    source_path
+)
+
+
+# ==================================================
+# Image Pack Configuration
+# ==================================================
+
+# Single file with every image, stored next to resources/images_pokemon
+PACK_PATH = Path("resources/images_pokemon.pack")
+
+PACK_MAGIC = b"PYDEXIMG"
+PACK_VERSION = 3
+
+# Device pixel ratios whose card thumbnails are packed by default
+PACK_RATIOS = (1.0,)
+
+
+# ==================================================
+# Binary Layout
+# ==================================================
+#
+#   header   magic, version, entry count and the mtime (ns) of the
+#            source image folder when the pack was built
+#   index    count x (id, pixel size, offset, length), sorted by (id, size)
+#   images   PNG files back to back, offsets relative to this section
+#
+# Each Pokémon has its original artwork plus the packed card sizes.
+# All integers are little-endian.
+
+HEADER = struct.Struct("<8sHIQ")
+INDEX_ENTRY = struct.Struct("<HHII")
+
+
+def source_stamp(root: Path = IMAGES_PATH) -> int:
+    """
+    Modification time (ns) of the source image folder. Adding, removing
+    or replacing an image (editors, installers and git write a new file)
+    changes it, and checking it costs one stat instead of one per image.
+    """
+    return root.stat().st_mtime_ns
+
+
+# ==================================================
+# Pack Writer
+# ==================================================
+
+def write_pack(entries: list[tuple[int, int, bytes]], path: Path = PACK_PATH, stamp: int = 0):
+    """
+    Packs (Pokémon ID, pixel size, PNG bytes) entries into one file,
+    stamped with the source_stamp() of the images they come from.
+    """
+
+    entries = sorted(entries, key=lambda entry: entry[:2])
+
+    index = bytearray()
+    offset = 0
+
+    for pokemon_id, size, data in entries:
+        index += INDEX_ENTRY.pack(pokemon_id, size, offset, len(data))
+        offset += len(data)
+
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(entries), stamp))
+        f.write(index)
+
+        for _, _, data in entries:
+            f.write(data)
+
+    tmp_path.replace(path)
+
+
+# ==================================================
+# Memory-mapped Pack Reader
+# ==================================================
+
+class ImagePack:
+    """
+    Read-only view over an image pack. The whole file is mapped once
+    and images are decoded straight from the mapping, so a cold start
+    reads one file sequentially instead of a thousand small ones.
+    A pack whose sources were added, removed or replaced since it was
+    built is refused, and the loose files are used instead.
+    """
+
+    def __init__(self, path: Path = PACK_PATH, images_path: Path = IMAGES_PATH):
+
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, stamp = HEADER.unpack_from(self._map, 0)
+
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Paquete de imágenes no válido: {path}")
+
+        if stamp != source_stamp(images_path):
+            self.close()
+            raise ValueError(f"Paquete de imágenes desactualizado: {path}")
+
+        # The index is small (a few KB): keep it decoded in memory
+        self._keys = []
+        self._spans = []
+
+        for position in range(count):
+            pokemon_id, size, offset, length = INDEX_ENTRY.unpack_from(
+                self._map, HEADER.size + position * INDEX_ENTRY.size
+            )
+            self._keys.append((pokemon_id, size))
+            self._spans.append((offset, length))
+
+        self._images_offset = HEADER.size + count * INDEX_ENTRY.size
+        self._view = memoryview(self._map)
+
+    @classmethod
+    def open(cls, path: Path = PACK_PATH) -> "ImagePack | None":
+        """Returns the pack, or None if it is missing or invalid."""
+
+        try:
+            return cls(path)
+
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # ==================================================
+    # Lookup
+    # ==================================================
+
+    def _find(self, pokemon_id: int, size: int) -> int | None:
+        """Smallest packed image of at least `size` px, else the largest one."""
+
+        position = bisect.bisect_left(self._keys, (pokemon_id, size))
+
+        if position < len(self._keys) and self._keys[position][0] == pokemon_id:
+            return position
+
+        if position > 0 and self._keys[position - 1][0] == pokemon_id:
+            return position - 1
+
+        return None
+
+    def image(self, pokemon_id: int, size: int) -> QImage | None:
+        """Decodes the packed image that best fits `size`, None if not packed."""
+
+        position = self._find(pokemon_id, size)
+
+        if position is None:
+            return None
+
+        offset, length = self._spans[position]
+        start = self._images_offset + offset
+
+        # Decoded from the mapping itself, the PNG bytes are never copied
+        with self._view[start:start + length] as data:
+            return QImage.fromData(data, "PNG")
+
+    def close(self):
+
+        if hasattr(self, "_view"):
+            self._view.release()
+
+        self._map.close()
+        self._file.close()
+
+
+# ==================================================
+# Pack Command
+# ==================================================
+#
+# Packs the artwork of resources/images_pokemon and its card
+# thumbnails. The loose files stay the fallback for anything the
+# pack lacks (or when no pack was built, or it is out of date).
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Empaqueta las imágenes de los Pokémon en un solo archivo.")
+    parser.add_argument("--ratio", type=float, nargs="+", default=list(PACK_RATIOS), help="Escalas de pantalla de las miniaturas")
+    parser.add_argument("--output", type=Path, default=PACK_PATH)
+    args = parser.parse_args()
+
+    thumbnails = ThumbnailCache()
+    ids = sorted(int(path.stem) for path in IMAGES_PATH.glob("*.png") if path.stem.isdigit())
+
+    start = time.perf_counter()
+    entries = {}
+
+    # Taken before reading, so an edit made meanwhile invalidates the pack
+    stamp = source_stamp()
+
+    for pokemon_id in ids:
+        entries[(pokemon_id, SOURCE_SIZE)] = source_path(pokemon_id).read_bytes()
+
+        for ratio in args.ratio:
+            size = thumbnails.pixel_size(ImageVariant.CARD, ratio)
+
+            if size < SOURCE_SIZE:
+                entries[(pokemon_id, size)] = thumbnails.path(pokemon_id, ImageVariant.CARD, ratio).read_bytes()
+
+    write_pack([(*key, data) for key, data in entries.items()], args.output, stamp)
+
+    size_mb = args.output.stat().st_size / (1024 * 1024)
+    print(f"{len(entries)} imágenes empaquetadas en {args.output} ({size_mb:.1f} MB, {time.perf_counter() - start:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
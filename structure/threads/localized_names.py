@@ -0,0 +1,223 @@
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import time
+
+from structure.threads.data_sources import BASE_URL, MirrorSource
+from structure.threads.decoders import LANGUAGE
+from structure.threads.rate_limiter import FetchPriority
+
+
+# ==================================================
+# Localization Configuration
+# ==================================================
+
+# Table shipped with the app (every type, abilities once prebuilt)
+LOCALIZATION_PATH = Path("resources/localization/names.json")
+
+# Names learned at runtime for resources missing from the shipped table
+LOCALIZATION_CACHE_PATH = Path("cache/localized_names.json")
+
+# Minimum time between writes of the runtime table (seconds)
+SAVE_INTERVAL = 30
+
+# Resource kinds covered by the tables
+KINDS = ("type", "ability")
+
+# Language used when the wanted one is missing from a resource
+FALLBACK_LANGUAGE = "en"
+
+
+def resource_id(url: str) -> int:
+    """PokeAPI ID at the end of a resource URL."""
+    return int(url.rstrip("/").rsplit("/", 1)[-1])
+
+
+# ==================================================
+# Localized Name Tables
+# ==================================================
+
+class LocalizedNames:
+    """
+    Type and ability names indexed by PokeAPI resource ID and language
+    code, so records never download a whole document just to read a name.
+    """
+
+    def __init__(self, path: Path = LOCALIZATION_PATH, cache_path: Path = LOCALIZATION_CACHE_PATH):
+
+        self.cache_path = cache_path
+
+        # Kind -> resource ID -> {language: name}
+        self._tables = {kind: {} for kind in KINDS}
+        self._learned = {kind: {} for kind in KINDS}
+
+        self._merge(self._tables, self._read(path))
+        self._merge(self._learned, self._read(cache_path))
+        self._merge(self._tables, self._learned)
+
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    @staticmethod
+    def _read(path: Path) -> dict:
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _merge(target: dict, source: dict):
+
+        for kind in KINDS:
+            for key, names in source.get(kind, {}).items():
+                target[kind][int(key)] = names
+
+    # ==================================================
+    # Lookup
+    # ==================================================
+
+    def get(self, kind: str, id_: int, language: str = LANGUAGE) -> str | None:
+        """Name of a resource in a language (English as fallback), or None."""
+
+        names = self._tables[kind].get(id_)
+
+        if not names:
+            return None
+
+        return names.get(language) or names.get(FALLBACK_LANGUAGE)
+
+    # ==================================================
+    # Learning & Persistence
+    # ==================================================
+
+    def add(self, kind: str, id_: int, document: dict):
+        """Stores the names of a /type/ or /ability/ document."""
+
+        names = {entry["language"]["name"]: entry["name"] for entry in document["names"]}
+
+        self._tables[kind][id_] = names
+        self._learned[kind][id_] = names
+        self._dirty = True
+
+        if time.monotonic() - self._saved_at > SAVE_INTERVAL:
+            self.save()
+
+    def save(self):
+        """Writes the names learned at runtime, if any changed."""
+
+        if not self._dirty:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            json.dump(self._learned, f, ensure_ascii=False)
+
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    async def complete(self, api, session, priority=FetchPriority.PREFETCH):
+        """
+        Downloads every name the tables still lack, at low priority, and
+        persists them with the names learned at runtime. Lists and
+        resources that fail are left for the next run.
+        """
+
+        for kind in KINDS:
+
+            # No list for this kind (offline, partial mirror): try next run
+            try:
+                documents = await fetch_documents(api, session, kind, self._tables[kind], priority)
+
+            except Exception:
+                continue
+
+            for id_, document in documents.items():
+                self.add(kind, id_, document)
+
+        self.save()
+
+
+# ==================================================
+# Table Download
+# ==================================================
+
+async def fetch_documents(api, session, kind, known=(), priority=FetchPriority.VISIBLE) -> dict:
+    """Every /type/ or /ability/ document whose ID is not in `known`, by ID."""
+
+    listing = await api.fetch_data(session, f"{api.base_url}/{kind}/?limit=10000", priority)
+    urls = [result["url"] for result in listing["results"] if resource_id(result["url"]) not in known]
+
+    documents = await asyncio.gather(
+        *[api.fetch_data(session, url, priority) for url in urls],
+        return_exceptions=True
+    )
+
+    return {
+        resource_id(url): document
+        for url, document in zip(urls, documents)
+        if not isinstance(document, BaseException)
+    }
+
+
+# ==================================================
+# Table Builder
+# ==================================================
+#
+# Downloads every type and ability once and writes the table shipped
+# in resources/, so fresh installs resolve all names offline.
+
+async def _fetch_all(api, session) -> dict:
+
+    tables = {}
+
+    for kind in KINDS:
+        documents = await fetch_documents(api, session, kind)
+
+        tables[kind] = {
+            str(id_): {entry["language"]["name"]: entry["name"] for entry in document["names"]}
+            for id_, document in sorted(documents.items())
+        }
+
+        print(f"{kind}: {len(documents)} nombres")
+
+    return tables
+
+
+async def _build(args):
+
+    # Imported here: the API module itself depends on this one
+    from structure.threads.api_pokemon import APIPokemon
+    from structure.threads.fetch_service import create_session
+
+    source = MirrorSource(args.mirror) if args.mirror else None
+    api = APIPokemon(base_url=args.base_url, source=source)
+
+    async with create_session() as session:
+        tables = await _fetch_all(api, session)
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(tables, f, ensure_ascii=False, indent=4)
+
+    print(f"Tabla de nombres guardada en {args.output}")
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Genera la tabla de nombres de tipos y habilidades.")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--mirror", help="Carpeta con la copia local de api-data")
+    parser.add_argument("--output", default=str(LOCALIZATION_PATH))
+    args = parser.parse_args()
+
+    asyncio.run(_build(args))
+
+
+if __name__ == "__main__":
+    main()
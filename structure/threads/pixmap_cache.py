@@ -0,0 +1,120 @@
+from collections import OrderedDict
+
+
+# ==================================================
+# Pixmap Cache Configuration
+# ==================================================
+
+# Default memory budget for decoded Pokémon images (MB)
+PIXMAP_CACHE_MB = 48
+
+# Released images (no widget showing them) kept for a quick scroll back,
+# about three screens of cards; older ones go even under the budget
+RELEASED_MAX_IMAGES = 36
+
+
+# ==================================================
+# Pixmap LRU Cache
+# ==================================================
+
+class PixmapCache:
+    """
+    Decoded Pokémon images shared by the cards and the detail page,
+    keyed by (Pokémon ID, variant, pixel ratio) and kept under a byte
+    budget by evicting the least recently used ones. Widgets showing an
+    image hold it, and let go of it when it is evicted, so the budget
+    bounds the memory actually in use. Images nobody shows are capped
+    apart, so resident memory follows what is on screen, not the budget.
+    """
+
+    _instance = None
+
+    def __init__(self, max_bytes: int = PIXMAP_CACHE_MB * 1024 * 1024, max_released: int = RELEASED_MAX_IMAGES):
+        self.max_bytes = max_bytes
+        self.max_released = max_released
+        self.size = 0
+
+        # Key -> QPixmap, least recently used first
+        self._pixmaps = OrderedDict()
+
+        # Key -> release callbacks of the widgets showing that image
+        self._holders = {}
+
+    @classmethod
+    def instance(cls) -> "PixmapCache":
+
+        if cls._instance is None:
+            cls._instance = cls()
+
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    # ==================================================
+    # Lookup & Storage
+    # ==================================================
+
+    def get(self, key):
+
+        pixmap = self._pixmaps.get(key)
+
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+
+        return pixmap
+
+    def put(self, key, pixmap):
+
+        previous = self._pixmaps.pop(key, None)
+
+        if previous is not None:
+            self.size -= self._cost(previous)
+
+        self._pixmaps[key] = pixmap
+        self.size += self._cost(pixmap)
+
+        self._evict()
+
+    def hold(self, key, release):
+        """Registers a widget showing an image; release() runs on eviction."""
+
+        self._holders.setdefault(key, []).append(release)
+
+    def drop(self, key, release):
+        """Unregisters a widget that no longer shows an image."""
+
+        holders = self._holders.get(key)
+
+        if holders and release in holders:
+            holders.remove(release)
+
+            if not holders:
+                del self._holders[key]
+                self._evict()
+
+    def set_max_bytes(self, max_bytes: int):
+
+        self.max_bytes = max_bytes
+        self._evict()
+
+    @staticmethod
+    def _cost(pixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def _evict(self):
+
+        # The newest image always stays, even if it alone exceeds the budget
+        while self.size > self.max_bytes and len(self._pixmaps) > 1:
+            key, pixmap = self._pixmaps.popitem(last=False)
+            self.size -= self._cost(pixmap)
+
+            # A widget still showing it would keep the pixmap alive
+            for release in self._holders.pop(key, ()):
+                release()
+
+        # Least recently used first
+        released = [key for key in self._pixmaps if key not in self._holders]
+
+        for key in released[:max(0, len(released) - self.max_released)]:
+            self.size -= self._cost(self._pixmaps.pop(key))
@@ -0,0 +1,281 @@
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import mmap
+import struct
+
+
+# ==================================================
+# Snapshot Configuration
+# ==================================================
+
+# Read-only snapshot stored next to resources/images_pokemon
+SNAPSHOT_PATH = Path("resources/pokedex.snapshot")
+
+SNAPSHOT_MAGIC = b"PYDEXSNP"
+SNAPSHOT_VERSION = 1
+
+# Fixed order of the packed base stats column
+STAT_KEYS = (
+    "hp",
+    "attack",
+    "defense",
+    "special-attack",
+    "special-defense",
+    "speed"
+)
+
+# Type code used when a Pokémon has a single type
+NO_TYPE = 0xFF
+
+
+# ==================================================
+# Binary Layout
+# ==================================================
+#
+#   header   magic, version, record count, type table size
+#   types    UTF-8 JSON list with the type names used by the codes
+#   index    count x (id, blob offset, blob length), sorted by id
+#   columns  count x (6 stats, type 1, type 2, height, weight, gender)
+#   blobs    compact JSON with the variable-size text fields
+#
+# All integers are little-endian.
+
+HEADER = struct.Struct("<8sHHI")
+INDEX_ENTRY = struct.Struct("<HII")
+COLUMNS_ROW = struct.Struct("<6BBBHHb")
+
+
+# ==================================================
+# Snapshot Writer
+# ==================================================
+
+def write_snapshot(records: list[dict], path: Path = SNAPSHOT_PATH):
+    """
+    Packs normalized records (as returned by APIPokemon.fetch_pokemon)
+    into a single read-only snapshot file.
+    """
+
+    records = sorted(records, key=lambda record: record["id"])
+
+    type_names = sorted({type_ for record in records for type_ in record["types"]})
+    type_codes = {name: code for code, name in enumerate(type_names)}
+    type_table = json.dumps(type_names, ensure_ascii=False).encode("utf-8")
+
+    index = bytearray()
+    columns = bytearray()
+    blobs = bytearray()
+
+    for record in records:
+
+        blob = json.dumps(
+            {
+                "name": record["name"],
+                "abilities": record["abilities"],
+                "hidden_ability": record["hidden_ability"],
+                "description": record["description"]
+            },
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+        index += INDEX_ENTRY.pack(record["id"], len(blobs), len(blob))
+        blobs += blob
+
+        types = record["types"]
+
+        columns += COLUMNS_ROW.pack(
+            *(record["base_stats"].get(key, 0) for key in STAT_KEYS),
+            type_codes[types[0]],
+            type_codes[types[1]] if len(types) > 1 else NO_TYPE,
+            record["height"],
+            record["weight"],
+            record["gender_ratio"]
+        )
+
+    header = HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(records), len(type_table))
+
+    # Write to a temporary file first so readers never see a partial file
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(type_table)
+        f.write(index)
+        f.write(columns)
+        f.write(blobs)
+
+    tmp_path.replace(path)
+
+
+# ==================================================
+# Memory-mapped Snapshot Reader
+# ==================================================
+
+class PokedexSnapshot:
+    """
+    Read-only view over a snapshot file, memory-mapped so records
+    are decoded on demand without loading the whole file.
+    """
+
+    def __init__(self, path: Path = SNAPSHOT_PATH):
+
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.count, type_table_size = HEADER.unpack_from(self._map, 0)
+
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"Snapshot no válido: {path}")
+
+        offset = HEADER.size
+        self._type_names = json.loads(self._map[offset:offset + type_table_size])
+
+        self._index_offset = offset + type_table_size
+        self._columns_offset = self._index_offset + self.count * INDEX_ENTRY.size
+        self._blobs_offset = self._columns_offset + self.count * COLUMNS_ROW.size
+
+    @classmethod
+    def open(cls, path: Path = SNAPSHOT_PATH) -> "PokedexSnapshot | None":
+        """Returns the snapshot, or None if it is missing or invalid."""
+
+        try:
+            return cls(path)
+
+        except (OSError, ValueError, struct.error):
+            return None
+
+
+    # ==================================================
+    # Lookup
+    # ==================================================
+
+    def _id_at(self, position: int) -> int:
+        return INDEX_ENTRY.unpack_from(self._map, self._index_offset + position * INDEX_ENTRY.size)[0]
+
+    def _find(self, pokemon_id: int) -> int | None:
+
+        # Binary search over the fixed-width, id-sorted index table
+        low, high = 0, self.count - 1
+
+        while low <= high:
+            mid = (low + high) // 2
+            current = self._id_at(mid)
+
+            if current == pokemon_id:
+                return mid
+
+            if current < pokemon_id:
+                low = mid + 1
+            else:
+                high = mid - 1
+
+        return None
+
+    def __contains__(self, pokemon_id: int) -> bool:
+        return self._find(pokemon_id) is not None
+
+    @property
+    def max_id(self) -> int:
+        return self._id_at(self.count - 1) if self.count else 0
+
+    def get(self, pokemon_id: int) -> dict | None:
+
+        position = self._find(pokemon_id)
+
+        if position is None:
+            return None
+
+        _, blob_offset, blob_length = INDEX_ENTRY.unpack_from(
+            self._map, self._index_offset + position * INDEX_ENTRY.size
+        )
+
+        *stats, type_1, type_2, height, weight, gender = COLUMNS_ROW.unpack_from(
+            self._map, self._columns_offset + position * COLUMNS_ROW.size
+        )
+
+        start = self._blobs_offset + blob_offset
+        text = json.loads(self._map[start:start + blob_length])
+
+        types = [self._type_names[type_1]]
+
+        if type_2 != NO_TYPE:
+            types.append(self._type_names[type_2])
+
+        return {
+            "name": text["name"],
+            "id": pokemon_id,
+            "height": height,
+            "weight": weight,
+            "types": types,
+            "abilities": text["abilities"],
+            "hidden_ability": text["hidden_ability"],
+            "description": text["description"],
+            "gender_ratio": gender,
+            "base_stats": dict(zip(STAT_KEYS, stats))
+        }
+
+    def close(self):
+
+        self._map.close()
+        self._file.close()
+
+
+# ==================================================
+# Build Command
+# ==================================================
+
+async def _fetch_all(first_id: int, last_id: int, concurrency: int, mirror: str | None = None) -> list[dict]:
+
+    import aiohttp
+    from structure.threads.api_pokemon import APIPokemon
+    from structure.threads.data_sources import MirrorSource
+    from structure.threads.http_cache import HttpCache
+
+    source = MirrorSource(mirror) if mirror else None
+    api = APIPokemon(cache=HttpCache(), source=source)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession() as session:
+
+        async def fetch(pokemon_id):
+            async with semaphore:
+                return await api.fetch_pokemon(session, pokemon_id)
+
+        records = list(await asyncio.gather(*(fetch(i) for i in range(first_id, last_id + 1))))
+
+        # A second pass only re-requests the fields that failed
+        for position, record in enumerate(records):
+            if record["missing"]:
+                records[position] = await fetch(record["id"])
+
+    api.cache.close()
+
+    incomplete = [record["id"] for record in records if record["missing"]]
+
+    if incomplete:
+        raise SystemExit(f"Registros incompletos, vuelve a intentarlo: {incomplete}")
+
+    return records
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Construye el snapshot de la Pokédex.")
+    parser.add_argument("--last-id", type=int, default=1025)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_PATH)
+    parser.add_argument("--mirror", help="Carpeta con la copia local de api-data")
+    args = parser.parse_args()
+
+    records = asyncio.run(_fetch_all(1, args.last_id, args.concurrency, args.mirror))
+    write_snapshot(records, args.output)
+
+    print(f"Snapshot escrito en {args.output} ({len(records)} Pokémon)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from pathlib import Path
+import asyncio
+import difflib
+import json
+import time
+
+
+# ==================================================
+# Directory Configuration
+# ==================================================
+
+# Local copy of every Pokémon name and ID
+DIRECTORY_PATH = Path("cache/pokemon_directory.json")
+
+# Species list endpoint (relative to the API base URL), as a single page.
+# Species, not /pokemon: that list also names every alternate form
+DIRECTORY_ENDPOINT = "/pokemon-species/?limit=100000"
+
+# Age after which the directory is refreshed in the background (seconds)
+DIRECTORY_MAX_AGE = 30 * 24 * 60 * 60
+
+
+# ==================================================
+# Pokémon Name/ID Directory
+# ==================================================
+
+class PokemonDirectory:
+    """
+    Maps every Pokémon name to its PokeAPI ID so queries can be
+    resolved locally before any per-Pokémon request.
+    """
+
+    def __init__(self, entries: dict[str, int], created_at: float | None = None):
+
+        self._by_name = entries
+        self._ids = set(entries.values())
+        self.created_at = created_at or time.time()
+
+    # ==================================================
+    # Building & Persistence
+    # ==================================================
+
+    @classmethod
+    def load(cls, path: Path = DIRECTORY_PATH) -> "PokemonDirectory | None":
+        """Returns the directory stored on disk, or None if missing."""
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        # Built from another endpoint (older versions listed /pokemon)
+        if data.get("endpoint") != DIRECTORY_ENDPOINT:
+            return None
+
+        return cls(data["entries"], data["created_at"])
+
+    @classmethod
+    async def fetch(cls, api, session) -> "PokemonDirectory":
+        """Builds the directory from the PokeAPI species list."""
+
+        listing = await api.fetch_data(session, api.base_url + DIRECTORY_ENDPOINT)
+
+        entries = {
+            result["name"]: int(result["url"].rstrip("/").rsplit("/", 1)[-1])
+            for result in listing["results"]
+        }
+
+        directory = cls(entries)
+
+        # Written on a worker thread, never on the fetch loop
+        await asyncio.get_running_loop().run_in_executor(None, directory.save)
+
+        return directory
+
+    def save(self, path: Path = DIRECTORY_PATH):
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"endpoint": DIRECTORY_ENDPOINT, "created_at": self.created_at, "entries": self._by_name}, f)
+
+    @property
+    def is_stale(self) -> bool:
+        return time.time() - self.created_at > DIRECTORY_MAX_AGE
+
+    # ==================================================
+    # Lookup
+    # ==================================================
+
+    def resolve(self, query: int | str) -> int | None:
+        """Returns the ID for a name or numeric query, or None."""
+
+        query = str(query).strip().lower()
+
+        if query.isdigit():
+            pokemon_id = int(query)
+            return pokemon_id if pokemon_id in self._ids else None
+
+        return self._by_name.get(query.replace(" ", "-"))
+
+    def suggest(self, query: str, limit: int = 3) -> list[str]:
+        """Closest known names to a (possibly misspelled) query."""
+
+        return difflib.get_close_matches(query.lower(), self._by_name.keys(), n=limit)
+
+    def names(self) -> list[str]:
+        return sorted(self._by_name, key=self._by_name.get)
+
+    @property
+    def max_species_id(self) -> int:
+        return max(self._ids, default=0)
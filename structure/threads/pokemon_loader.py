@@ -1,34 +1,109 @@
-from PyQt5.QtCore import QThread, pyqtSignal
-import asyncio
-import aiohttp
-from structure.threads.api_pokemon import APIPokemon
+from PyQt5.QtCore import QObject, pyqtSignal
+from structure.threads.fetch_service import FetchService
+from structure.threads.rate_limiter import FetchPriority
+from structure.threads.api_pokemon import FetchProfile
+from structure.threads.cancel_token import CancelToken
 from structure.custom_exceptions import InternetConnectionError
 from structure.custom_exceptions import PokemonNotFoundError
+from structure.custom_exceptions import LoadCancelledError
 
-class PokemonLoader(QThread):
+class PokemonLoader(QObject):
+    """
+    Submits a Pokémon load to the shared FetchService and
+    reports the result back to the GUI thread through signals.
+
+    The profile picks the record fields: CARD costs a single request,
+    DETAIL adds the species and ability data for the detail page.
+    """
 
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, query: int | str):
+    # Raw results from the service thread, filtered in the GUI thread
+    _loaded = pyqtSignal(dict)
+    _failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        query: int | str,
+        priority: FetchPriority = FetchPriority.VISIBLE,
+        profile: FetchProfile = FetchProfile.DETAIL,
+        card: dict | None = None
+    ):
         super().__init__()
         self.query = query
+        self.priority = priority
+        self.profile = profile
+
+        # Card already on screen: only the detail phase is left
+        self.card = card
+
+        self.token = CancelToken()
+        self._future = None
+
+        self._loaded.connect(self._deliverLoaded)
+        self._failed.connect(self._deliverFailed)
+
+    def start(self):
+
+        service = FetchService.instance()
+        self._future = service.submit(self._load(service))
+
+        # Cancelling the token aborts the running requests as well
+        self.token.add_callback(self._future.cancel)
+
+    def cancel(self):
+        self.token.cancel()
+
+    def isRunning(self) -> bool:
+        return self._future is not None and not self._future.done()
 
-    def run(self):
+    async def _load(self, service):
 
+        # Records present in the snapshot never touch the network
+        if service.snapshot and str(self.query).isdigit():
+            data = service.snapshot.get(int(self.query))
+
+            if data:
+                self._loaded.emit(data)
+                return
+
+        # Signals emitted from the service thread are queued to the GUI thread
         try:
-            asyncio.run(self._load())
+            card = self.card
+
+            if card is None:
+                card = await service.api.fetch_card(service.session, self.query, self.priority, self.token)
+
+            details = {}
+
+            if self.profile == FetchProfile.DETAIL:
+                self.token.raise_if_cancelled()
+                details = await service.api.fetch_details(service.session, card["id"], self.priority, self.token)
+
+        except LoadCancelledError:
+            return
 
         except InternetConnectionError as e:
-            self.error.emit("Error de conexión al cargar el Pokémon")
+            self._failed.emit("Error de conexión al cargar el Pokémon")
 
         except PokemonNotFoundError as e:
-            self.error.emit("No se encontró ningún Pokémon con ese nombre o ID")
+            self._failed.emit("No se encontró ningún Pokémon con ese nombre o ID")
+
+        except Exception as e:
+            self._failed.emit("Error inesperado al cargar el Pokémon")
+
+        else:
+            self._loaded.emit({**card, **details})
+
+    # Results that arrive after cancel() are stale and dropped
+
+    def _deliverLoaded(self, data: dict):
 
-    async def _load(self):
+        if not self.token.cancelled:
+            self.finished.emit(data)
 
-        async with aiohttp.ClientSession() as session:
-            api = APIPokemon()
-            data = await api.fetch_pokemon(session, self.query)
+    def _deliverFailed(self, message: str):
 
-            self.finished.emit(data)
\ No newline at end of file
+        if not self.token.cancelled:
+            self.error.emit(message)
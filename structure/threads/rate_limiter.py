@@ -0,0 +1,210 @@
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+import asyncio
+import heapq
+import itertools
+import random
+
+
+# ==================================================
+# Limiter Configuration
+# ==================================================
+
+# Concurrency bounds for requests in flight to PokeAPI
+LIMIT_INITIAL = 6
+LIMIT_MIN = 1
+LIMIT_MAX = 10
+
+# Latency above (recent best latency x tolerance) counts as congestion
+LATENCY_TOLERANCE = 2.0
+
+# Number of recent responses the best-latency baseline is taken from
+LATENCY_WINDOW = 32
+
+# Multiplicative decrease on congestion and on throttling (429/5xx)
+CONGESTION_FACTOR = 0.9
+THROTTLE_FACTOR = 0.5
+
+# Slots kept free for interactive and visible work
+RESERVED_SLOTS = 1
+
+# Retry policy: exponential backoff with full jitter (seconds)
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+
+
+# ==================================================
+# Fetch Priorities
+# ==================================================
+
+class FetchPriority(IntEnum):
+    """
+    Scheduling priority of a fetch, lower values are served first.
+    """
+    INTERACTIVE = 0  # Search and detail page
+    VISIBLE = 1      # Cards inside the viewport
+    OFFSCREEN = 2    # Cards below the fold
+    PREFETCH = 3     # Speculative loads
+
+
+# ==================================================
+# Adaptive Concurrency Limiter
+# ==================================================
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter: the cap grows slowly while requests
+    are fast and healthy, and shrinks quickly on slow responses or
+    when PokeAPI throttles (429) or fails (5xx). Waiting requests
+    are granted slots in priority order.
+    """
+
+    def __init__(self, initial: int = LIMIT_INITIAL, minimum: int = LIMIT_MIN, maximum: int = LIMIT_MAX):
+
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+
+        self._in_flight = 0
+
+        # Heap of [priority, sequence, waiter, key]; waiter None = stale
+        self._queue = []
+        self._sequence = itertools.count()
+
+        # Key (URL) -> queued heap entry, used for promotion
+        self._queued = {}
+
+        # Latencies of the last responses; their minimum is the congestion
+        # baseline, so one unusually fast answer only counts for a while
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+
+
+    # ==================================================
+    # Slot Management
+    # ==================================================
+
+    @asynccontextmanager
+    async def slot(self, priority: FetchPriority = FetchPriority.VISIBLE, key: str | None = None):
+
+        await self._acquire(priority, key)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority, key):
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._sequence), waiter, key]
+
+        heapq.heappush(self._queue, entry)
+
+        if key is not None:
+            self._queued[key] = entry
+
+        self._wake()
+
+        try:
+            await waiter
+
+        except asyncio.CancelledError:
+            # The slot was granted right before the cancellation
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+        finally:
+            queued = self._queued.get(key)
+
+            if queued is not None and queued[2] is waiter:
+                del self._queued[key]
+
+    def promote(self, key: str, priority: FetchPriority):
+        """Raises the priority of a queued request (e.g. a search joined it)."""
+
+        entry = self._queued.get(key)
+
+        if entry is None or entry[0] <= priority or entry[2] is None:
+            return
+
+        promoted = [priority, next(self._sequence), entry[2], key]
+
+        # Leave the old heap entry behind as stale
+        entry[2] = None
+
+        heapq.heappush(self._queue, promoted)
+        self._queued[key] = promoted
+
+        self._wake()
+
+    def _release(self):
+
+        self._in_flight -= 1
+        self._wake()
+
+    def _has_capacity(self, priority) -> bool:
+
+        limit = int(self.limit)
+
+        # Background work never takes the reserved slots
+        if priority >= FetchPriority.OFFSCREEN:
+            limit = max(1, limit - RESERVED_SLOTS)
+
+        return self._in_flight < limit
+
+    def _wake(self):
+
+        while self._queue:
+            priority, _, waiter, _ = self._queue[0]
+
+            # Drop stale (promoted) and cancelled entries
+            if waiter is None or waiter.done():
+                heapq.heappop(self._queue)
+                continue
+
+            if not self._has_capacity(priority):
+                break
+
+            heapq.heappop(self._queue)
+            self._in_flight += 1
+            waiter.set_result(None)
+
+
+    # ==================================================
+    # Feedback
+    # ==================================================
+
+    def record_success(self, latency: float):
+
+        self._latencies.append(latency)
+
+        # Slow answer: back off a little
+        if latency > min(self._latencies) * LATENCY_TOLERANCE:
+            self.limit = max(self.minimum, self.limit * CONGESTION_FACTOR)
+
+        # Healthy answer: roughly +1 per full window of successes
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+        self._wake()
+
+    def record_throttle(self):
+        self.limit = max(self.minimum, self.limit * THROTTLE_FACTOR)
+
+
+# ==================================================
+# Retry Backoff
+# ==================================================
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Delay before the next attempt (full jitter, honoring Retry-After)."""
+
+    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(RETRY_MAX_DELAY, float(retry_after)))
+
+    return delay
@@ -0,0 +1,135 @@
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from enum import Enum
+import random
+
+
+# ==================================================
+# Retry Configuration
+# ==================================================
+
+# Backoff before probing again after a failure, doubling per attempt (ms)
+RETRY_BASE_DELAY_MS = 2000
+RETRY_MAX_DELAY_MS = 60000
+
+
+# ==================================================
+# Circuit Breaker States
+# ==================================================
+
+class BreakerState(Enum):
+    """
+    CLOSED: no outage known, OPEN: waiting out the backoff,
+    HALF_OPEN: a single probe card is being retried.
+    """
+    CLOSED = 1
+    OPEN = 2
+    HALF_OPEN = 3
+
+
+# ==================================================
+# Retry Queue
+# ==================================================
+
+class RetryQueue(QObject):
+    """
+    Failed Pokémon cards waiting to be retried. A circuit breaker
+    spaces the attempts with exponential backoff, retries one card
+    first and only releases the rest, as one batch, once it loads.
+    """
+
+    # Emitted whenever cards enter or leave the queue
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.state = BreakerState.CLOSED
+
+        self._pending = []
+        self._probe = None
+        self._attempt = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._halfOpen)
+
+    def __len__(self) -> int:
+        return len(self._pending) + (self._probe is not None)
+
+    # ==================================================
+    # Public API
+    # ==================================================
+
+    def add(self, widget):
+        """Queues a card whose load failed."""
+
+        # The probe failed: the outage goes on, back off further
+        if widget is self._probe:
+            self._disconnectProbe()
+            self._pending.insert(0, widget)
+            self._attempt += 1
+            self._open()
+
+        elif widget not in self._pending:
+            self._pending.append(widget)
+
+            if self.state == BreakerState.CLOSED:
+                self._open()
+
+        self.changed.emit()
+
+    def retry_now(self):
+        """Skips the backoff (retry button, connection restored)."""
+
+        if self._pending and self.state != BreakerState.HALF_OPEN:
+            self._timer.stop()
+            self._halfOpen()
+
+    # ==================================================
+    # Breaker Transitions
+    # ==================================================
+
+    def _open(self):
+
+        self.state = BreakerState.OPEN
+
+        delay = min(RETRY_MAX_DELAY_MS, RETRY_BASE_DELAY_MS * 2 ** self._attempt)
+
+        # Jitter so several windows do not retry in lockstep
+        self._timer.start(int(random.uniform(0.5, 1.0) * delay))
+
+    def _halfOpen(self):
+
+        if not self._pending:
+            self._close()
+            return
+
+        self.state = BreakerState.HALF_OPEN
+
+        self._probe = self._pending.pop(0)
+        self._probe.loaded.connect(self._onProbeLoaded)
+        self._probe.retry_loading()
+
+    def _onProbeLoaded(self):
+
+        self._disconnectProbe()
+        self._close()
+
+        # The API answers again: re-fetch every queued card at once
+        batch, self._pending = self._pending, []
+
+        for widget in batch:
+            widget.retry_loading()
+
+        self.changed.emit()
+
+    def _close(self):
+
+        self.state = BreakerState.CLOSED
+        self._attempt = 0
+        self._timer.stop()
+
+    def _disconnectProbe(self):
+
+        self._probe.loaded.disconnect(self._onProbeLoaded)
+        self._probe = None
@@ -0,0 +1,133 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+import asyncio
+
+from structure.threads.fetch_service import FetchService
+from structure.threads.rate_limiter import FetchPriority
+from structure.threads.cancel_token import CancelToken
+
+
+# ==================================================
+# Prefetch Configuration
+# ==================================================
+
+# Distance to the bottom (in viewport heights) that triggers a prefetch
+PREFETCH_MARGIN_SCREENS = 1.0
+
+# Default number of batches fetched ahead and of prefetches in flight
+PREFETCH_DEPTH = 1
+PREFETCH_BUDGET = 3
+
+
+# ==================================================
+# Scroll Prefetcher
+# ==================================================
+
+class ScrollPrefetcher(QObject):
+    """
+    Watches the Pokédex scroll position and, once the user gets near
+    the bottom, fetches the cards of the next batches into the cache
+    at PREFETCH priority, so "Cargar más" mostly renders local data.
+    """
+
+    # IDs whose prefetch failed, sent back to the GUI thread
+    _failed = pyqtSignal(list)
+
+    def __init__(self, scroll_area, planner, parent=None):
+        """
+        planner(depth) returns the Pokémon IDs the next `depth`
+        batches will load (empty when nothing should be prefetched).
+        """
+        super().__init__(parent)
+
+        self.scroll_area = scroll_area
+        self.planner = planner
+
+        # Batches fetched ahead (0 disables) and prefetches in flight
+        self.depth = PREFETCH_DEPTH
+        self.budget = PREFETCH_BUDGET
+
+        # IDs already prefetched (or being prefetched) in this session
+        self._prefetched = set()
+
+        self.token = None
+        self._future = None
+
+        self._failed.connect(self._onFailed)
+
+        scrollbar = scroll_area.verticalScrollBar()
+        scrollbar.valueChanged.connect(self.check)
+        scrollbar.rangeChanged.connect(self.check)
+
+    # ==================================================
+    # Trigger
+    # ==================================================
+
+    def isNearBottom(self) -> bool:
+
+        scrollbar = self.scroll_area.verticalScrollBar()
+        margin = self.scroll_area.viewport().height() * PREFETCH_MARGIN_SCREENS
+
+        return scrollbar.maximum() - scrollbar.value() <= margin
+
+    def check(self, *args):
+        """Starts a prefetch when near the bottom and none is running."""
+
+        if self.depth <= 0 or self.isRunning() or not self.isNearBottom():
+            return
+
+        ids = [pokemon_id for pokemon_id in self.planner(self.depth) if pokemon_id not in self._prefetched]
+
+        if not ids:
+            return
+
+        service = FetchService.instance()
+
+        # A local mirror answers instantly, there is nothing to hide
+        if service.source.local or not service.connectivity.online:
+            return
+
+        self._prefetched.update(ids)
+
+        self.token = CancelToken()
+        self._future = service.submit(self._prefetch(service, ids, self.token))
+        self.token.add_callback(self._future.cancel)
+
+    def cancel(self):
+
+        if self.token:
+            self.token.cancel()
+
+    def isRunning(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    # ==================================================
+    # Prefetch (runs on the FetchService loop)
+    # ==================================================
+
+    async def _prefetch(self, service, ids, token):
+
+        budget = asyncio.Semaphore(max(1, self.budget))
+
+        async def prefetch_one(pokemon_id):
+
+            # Records in the snapshot are local already
+            if service.snapshot and pokemon_id in service.snapshot:
+                return
+
+            async with budget:
+                token.raise_if_cancelled()
+
+                # The card lands in the HTTP cache; a real load joins it if still running
+                await service.api.fetch_card(service.session, pokemon_id, FetchPriority.PREFETCH, token)
+
+        results = await asyncio.gather(*[prefetch_one(pokemon_id) for pokemon_id in ids], return_exceptions=True)
+
+        failed = [pokemon_id for pokemon_id, result in zip(ids, results) if isinstance(result, BaseException)]
+
+        if failed:
+            self._failed.emit(failed)
+
+    def _onFailed(self, ids: list):
+
+        # Eligible again on the next scroll (the regular load may get them first)
+        self._prefetched.difference_update(ids)
@@ -0,0 +1,166 @@
+from PyQt5.QtGui import QImage
+from PyQt5.QtCore import Qt
+from enum import Enum
+from pathlib import Path
+import argparse
+import os
+import tempfile
+import time
+
+
+# ==================================================
+# Thumbnail Configuration
+# ==================================================
+
+# Original artwork shipped with the app, one PNG per Pokémon
+IMAGES_PATH = Path("resources/images_pokemon")
+
+# Side of every original image (px)
+SOURCE_SIZE = 215
+
+# Pre-scaled copies, one folder per variant and device pixel ratio
+THUMBNAILS_PATH = Path("cache/thumbnails")
+
+# Device pixel ratios built by the command line tool by default
+BUILD_RATIOS = (1.0, 2.0)
+
+
+# ==================================================
+# Image Variants
+# ==================================================
+
+class ImageVariant(Enum):
+    """
+    Logical size (in px) an image is drawn at.
+    """
+    CARD = 115    # label_img on the Pokédex cards
+    DETAIL = 215  # label_page_img on the detail page
+
+
+def source_path(pokemon_id: int) -> Path:
+    return IMAGES_PATH / f"{pokemon_id:03d}.png"
+
+
+# ==================================================
+# Thumbnail Cache
+# ==================================================
+
+class ThumbnailCache:
+    """
+    Card-sized copies of the Pokémon artwork, scaled once for each
+    device pixel ratio and rebuilt when the source file is newer.
+    Variants as large as the source are served from the source.
+    """
+
+    def __init__(self, root: Path = THUMBNAILS_PATH):
+        self.root = root
+
+    def path(self, pokemon_id: int, variant: ImageVariant, ratio: float = 1.0) -> Path:
+        """File to decode for a variant, building the thumbnail if missing or stale."""
+
+        source = source_path(pokemon_id)
+        size = self.pixel_size(variant, ratio)
+
+        thumbnail = self.root / f"{variant.name.lower()}@{ratio:g}x" / source.name
+
+        try:
+            source_mtime = source.stat().st_mtime
+
+        except OSError:
+            return source
+
+        # No point in a copy that is not smaller than the original
+        if size >= SOURCE_SIZE:
+            return source
+
+        try:
+            if thumbnail.stat().st_mtime >= source_mtime:
+                return thumbnail
+
+        except OSError:
+            pass
+
+        return thumbnail if self._build(source, thumbnail, size) else source
+
+    @staticmethod
+    def pixel_size(variant: ImageVariant, ratio: float = 1.0) -> int:
+        return round(variant.value * ratio)
+
+    @staticmethod
+    def _build(source: Path, thumbnail: Path, size: int) -> bool:
+
+        image = QImage(str(source))
+
+        if image.isNull():
+            return False
+
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        partial = None
+
+        # Unwritable or full cache folder, or (on Windows) a thumbnail being
+        # read while replaced: the caller falls back to the source image
+        try:
+            thumbnail.parent.mkdir(parents=True, exist_ok=True)
+
+            # Written aside and moved in, so a reader never sees half a file;
+            # unique per call, image workers may build the same thumbnail at once
+            with tempfile.NamedTemporaryFile(dir=thumbnail.parent, suffix=".part", delete=False) as f:
+                partial = f.name
+
+            if not image.save(partial, "PNG"):
+                os.remove(partial)
+                return False
+
+            os.replace(partial, thumbnail)
+            return True
+
+        except OSError:
+            ThumbnailCache._discard(partial)
+            return False
+
+    @staticmethod
+    def _discard(partial: str | None):
+
+        if partial is None:
+            return
+
+        try:
+            os.remove(partial)
+
+        except OSError:
+            pass
+
+
+# Shared by the cards and the detail page
+thumbnails = ThumbnailCache()
+
+
+# ==================================================
+# Thumbnail Builder
+# ==================================================
+#
+# Builds every card thumbnail ahead of time (e.g. when packaging),
+# so the first run does not scale the artwork on demand.
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Genera las miniaturas de las imágenes de los Pokémon.")
+    parser.add_argument("--ratio", type=float, nargs="+", default=list(BUILD_RATIOS), help="Escalas de pantalla")
+    parser.add_argument("--output", default=str(THUMBNAILS_PATH))
+    args = parser.parse_args()
+
+    cache = ThumbnailCache(Path(args.output))
+    ids = sorted(int(path.stem) for path in IMAGES_PATH.glob("*.png") if path.stem.isdigit())
+
+    start = time.perf_counter()
+
+    for ratio in args.ratio:
+        for pokemon_id in ids:
+            cache.path(pokemon_id, ImageVariant.CARD, ratio)
+
+    print(f"{len(ids)} miniaturas x {len(args.ratio)} escalas en {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
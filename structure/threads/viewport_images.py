@@ -0,0 +1,89 @@
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+
+# ==================================================
+# Viewport Image Configuration
+# ==================================================
+
+# Cards this close to the viewport (in viewport heights) get their image
+LOAD_MARGIN_SCREENS = 0.5
+
+# Cards farther than this release it (kept apart from the load margin
+# so cards at the edge do not reload at every scroll step)
+UNLOAD_MARGIN_SCREENS = 3.0
+
+
+# ==================================================
+# Viewport Image Manager
+# ==================================================
+
+class ViewportImages(QObject):
+    """
+    Loads the artwork of the Pokédex cards near the visible part of
+    the scroll area and releases it from cards scrolled far away, so
+    resident image memory follows the viewport, not the Pokédex size.
+    """
+
+    def __init__(self, scroll_area, cards, parent=None):
+        """
+        cards() returns every card widget, including the ones
+        currently out of the grid (filtered out or searching).
+        """
+        super().__init__(parent)
+
+        self.scroll_area = scroll_area
+        self.cards = cards
+
+        # Scroll, resize and relayout bursts collapse into one pass
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.update)
+
+        scrollbar = scroll_area.verticalScrollBar()
+        scrollbar.valueChanged.connect(self.schedule)
+        scrollbar.rangeChanged.connect(self.schedule)
+
+        scroll_area.viewport().installEventFilter(self)
+        scroll_area.widget().installEventFilter(self)
+
+    def schedule(self, *args):
+        self._timer.start()
+
+    def eventFilter(self, obj, event):
+
+        if event.type() in (QEvent.Resize, QEvent.LayoutRequest):
+            self.schedule()
+
+        return False
+
+    # ==================================================
+    # Load & Release
+    # ==================================================
+
+    def update(self):
+
+        content = self.scroll_area.widget()
+        height = self.scroll_area.viewport().height()
+
+        top = self.scroll_area.verticalScrollBar().value()
+        bottom = top + height
+
+        load_margin = height * LOAD_MARGIN_SCREENS
+        unload_margin = height * UNLOAD_MARGIN_SCREENS
+
+        for card in self.cards():
+
+            # Out of the grid (filtered out, search results shown)
+            if card.parentWidget() is not content:
+                card.release_image()
+                continue
+
+            card_top = card.y()
+            card_bottom = card_top + card.target_height
+
+            if card_bottom >= top - load_margin and card_top <= bottom + load_margin:
+                card.load_image()
+
+            elif card_bottom < top - unload_margin or card_top > bottom + unload_margin:
+                card.release_image()
@@ -3,7 +3,8 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QScrollArea,
     QWidget,
-    QToolButton
+    QToolButton,
+    QFileDialog
 )
 from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import QSize, pyqtSignal, Qt
@@ -16,9 +17,20 @@ from qfluentwidgets import (
     qconfig,
     SettingCardGroup,
     RangeSettingCard,
-    HyperlinkCard
+    HyperlinkCard,
+    ConfigItem,
+    OptionsConfigItem,
+    OptionsValidator,
+    ComboBoxSettingCard,
+    PushSettingCard,
+    BoolValidator,
+    SwitchSettingCard
 )
 
+from structure.threads.data_sources import BASE_URL, SOURCE_HTTP, SOURCE_MIRROR
+from structure.threads.scroll_prefetcher import PREFETCH_DEPTH, PREFETCH_BUDGET
+from structure.threads.pixmap_cache import PIXMAP_CACHE_MB
+
 # ==================================================
 # Application Configuration Model
 # ==================================================
@@ -39,6 +51,13 @@ class Config(QConfig):
         RangeValidator(1, 40)  # Allowed range
     )
 
+    imageCacheMB = RangeConfigItem(
+        "General",          # Configuration group
+        "ImageCacheMB",     # Configuration key (memory for decoded images)
+        PIXMAP_CACHE_MB,    # Default value
+        RangeValidator(16, 256)  # Allowed range
+    )
+
     # ------------------------------
     # Audio Settings
     # ------------------------------
@@ -50,6 +69,44 @@ class Config(QConfig):
         RangeValidator(0, 100)  # Allowed range
     )
 
+    # ------------------------------
+    # Data Source Settings
+    # ------------------------------
+
+    dataSource = OptionsConfigItem(
+        "Data",             # Configuration group
+        "Source",           # Configuration key
+        SOURCE_HTTP,        # Default value
+        OptionsValidator([SOURCE_HTTP, SOURCE_MIRROR])
+    )
+
+    # Base URL used by the HTTP source (PokeAPI or a compatible server)
+    apiBaseUrl = ConfigItem("Data", "BaseUrl", BASE_URL)
+
+    # api-data folder used by the mirror source
+    mirrorPath = ConfigItem("Data", "MirrorPath", "")
+
+    # Decode large payloads in worker processes (keeps the UI smooth)
+    decodeInProcess = ConfigItem("Data", "DecodeInProcess", False, BoolValidator())
+
+    # ------------------------------
+    # Prefetch Settings
+    # ------------------------------
+
+    prefetchDepth = RangeConfigItem(
+        "Prefetch",         # Configuration group
+        "Depth",            # Configuration key (batches fetched ahead, 0 = off)
+        PREFETCH_DEPTH,     # Default value
+        RangeValidator(0, 3)  # Allowed range
+    )
+
+    prefetchBudget = RangeConfigItem(
+        "Prefetch",         # Configuration group
+        "Budget",           # Configuration key (prefetch requests in flight)
+        PREFETCH_BUDGET,    # Default value
+        RangeValidator(1, 6)  # Allowed range
+    )
+
 
 # ==================================================
 # Configuration Page UI
@@ -153,7 +210,17 @@ class ConfigPage(QWidget):
             general_group
         )
 
+        # Memory budget for Pokémon images
+        self.range_image_cache = RangeSettingCard(
+            self.cfg.imageCacheMB,
+            FluentIcon.PHOTO,
+            "Memoria para imágenes (MB)",
+            "Memoria máxima que ocupan las imágenes de los Pokémon ya cargadas. Las menos usadas se descartan primero.",
+            general_group
+        )
+
         general_group.addSettingCard(self.range_num_pokemon)
+        general_group.addSettingCard(self.range_image_cache)
 
         # ==================================================
         # Audio Settings Section
@@ -171,6 +238,60 @@ class ConfigPage(QWidget):
 
         audio_group.addSettingCard(self.sound_volume)
 
+        # ==================================================
+        # Data Source Section
+        # ==================================================
+
+        data_group = SettingCardGroup("Fuente de datos", container)
+
+        self.combo_data_source = ComboBoxSettingCard(
+            self.cfg.dataSource,
+            FluentIcon.CLOUD,
+            "Origen de los datos Pokémon",
+            "PokeAPI por internet o una copia local de api-data. Se aplica al reiniciar la aplicación.",
+            texts=["PokeAPI (internet)", "Copia local (api-data)"],
+            parent=data_group
+        )
+
+        self.btn_mirror_path = PushSettingCard(
+            "Elegir carpeta",
+            FluentIcon.FOLDER,
+            "Carpeta de la copia local",
+            self.cfg.mirrorPath.value or "Ninguna carpeta seleccionada",
+            data_group
+        )
+        self.btn_mirror_path.clicked.connect(self._chooseMirrorFolder)
+
+        self.switch_decode_process = SwitchSettingCard(
+            FluentIcon.SPEED_HIGH,
+            "Procesar datos en segundo plano",
+            "Decodifica las respuestas grandes en procesos aparte para que la interfaz no se trabe. Se aplica al reiniciar la aplicación.",
+            self.cfg.decodeInProcess,
+            data_group
+        )
+
+        self.range_prefetch_depth = RangeSettingCard(
+            self.cfg.prefetchDepth,
+            FluentIcon.DOWNLOAD,
+            "Precarga al desplazarse",
+            "Cuántas cargas de Pokémon se descargan por adelantado al acercarte al final de la Pokédex (0 la desactiva).",
+            data_group
+        )
+
+        self.range_prefetch_budget = RangeSettingCard(
+            self.cfg.prefetchBudget,
+            FluentIcon.SPEED_MEDIUM,
+            "Descargas simultáneas de la precarga",
+            "Limita cuántas descargas por adelantado se hacen a la vez, para no competir con las cargas visibles.",
+            data_group
+        )
+
+        data_group.addSettingCard(self.combo_data_source)
+        data_group.addSettingCard(self.btn_mirror_path)
+        data_group.addSettingCard(self.switch_decode_process)
+        data_group.addSettingCard(self.range_prefetch_depth)
+        data_group.addSettingCard(self.range_prefetch_budget)
+
         # ==================================================
         # Project Information Section
         # ==================================================
@@ -196,6 +317,8 @@ class ConfigPage(QWidget):
         layout.addSpacing(24)
         layout.addWidget(audio_group)
         layout.addSpacing(24)
+        layout.addWidget(data_group)
+        layout.addSpacing(24)
         layout.addWidget(project_group)
         layout.addStretch(1)
 
@@ -204,3 +327,18 @@ class ConfigPage(QWidget):
         main_layout = QVBoxLayout(self)
         main_layout.addLayout(top_bar)
         main_layout.addWidget(scroll)
+
+
+    # ==================================================
+    # Data Source Actions
+    # ==================================================
+
+    def _chooseMirrorFolder(self):
+
+        folder = QFileDialog.getExistingDirectory(self, "Carpeta de api-data", self.cfg.mirrorPath.value)
+
+        if not folder:
+            return
+
+        qconfig.set(self.cfg.mirrorPath, folder)
+        self.btn_mirror_path.setContent(folder)
@@ -10,6 +10,11 @@ from PyQt5.QtCore import (
 from PyQt5.uic import loadUi
 
 from structure.threads.pokemon_loader import PokemonLoader
+from structure.threads.rate_limiter import FetchPriority
+from structure.threads.api_pokemon import FetchProfile, DETAIL_FIELDS
+from structure.threads.thumbnail_cache import ImageVariant
+from structure.threads.image_loader import ImageLoader, placeholder_pixmap
+from structure.threads.pixmap_cache import PixmapCache
 from structure.styles.apply_typeStyleSheet import apply_type
 
 from qfluentwidgets.components.widgets.info_bar import InfoBarPosition
@@ -55,6 +60,10 @@ class GenderIndicator:
 
         self.reset()
 
+        # Gender ratio not loaded yet
+        if gender_rate is None:
+            return
+
         # No gender Pokémon
         if gender_rate == -1:
             self._show_no_gender()
@@ -111,19 +120,31 @@ class WidgetPokemon(QWidget):
     loaded = pyqtSignal()
     failed = pyqtSignal(object)
     selected = pyqtSignal(dict)  # Emits full Pokémon data
+    detailsFailed = pyqtSignal(str)
 
 
-    def __init__(self, id_: int | str, main_window):
+    def __init__(self, id_: int | str, main_window, priority: FetchPriority = FetchPriority.VISIBLE):
         super().__init__(main_window)
 
         # ---------------- Internal Attributes ----------------
 
         self.query = id_
+        self.priority = priority
         self.pokemon_id = None
         self.main_window = main_window
         self.state = None
         self._animated = False
 
+        # Detail fields (abilities, description...) load on hover or click
+        self.hydrated = False
+        self.details_loader = None
+        self._open_pending = False
+
+        # Artwork decoded off the GUI thread (held by the shared PixmapCache),
+        # only while the card is near the viewport (see ViewportImages)
+        self.image_loader = None
+        self._image_requested = False
+
         # ---------------- UI Loading ----------------
 
         # Load the .ui file designed in Qt Designer
@@ -163,13 +184,53 @@ class WidgetPokemon(QWidget):
     def _startLoading(self):
         """
         Start asynchronous loading of Pokémon data.
+        Cards only fetch the card profile, details load on demand.
         """
-        self.loader = PokemonLoader(self.query)
+        self.loader = PokemonLoader(self.query, self.priority, FetchProfile.CARD)
         self.loader.finished.connect(self._onLoaded)
         self.loader.error.connect(self._onError)
         self.loader.start()
 
 
+    def load_details(self, priority: FetchPriority = FetchPriority.VISIBLE):
+        """
+        Fetch the detail profile unless it is loaded or already requested
+        with at least the same priority.
+        """
+        if self.hydrated or self.state != WidgetState.READY:
+            return
+
+        running = self.details_loader and self.details_loader.isRunning()
+
+        if running and self.details_loader.priority <= priority:
+            return
+
+        previous = self.details_loader
+
+        # A more urgent load joins the running requests and moves them forward
+        self.details_loader = PokemonLoader(self.pokemon_id, priority, FetchProfile.DETAIL, card=self.data)
+        self.details_loader.finished.connect(self._onHydrated)
+        self.details_loader.error.connect(self._onDetailsError)
+        self.details_loader.start()
+
+        # Cancelled once the new one is submitted, so the shared requests
+        # keep a waiter; its late result or error never reaches the card
+        if previous:
+            previous.cancel()
+
+
+    def open_details(self):
+        """
+        Emit the full record, loading the detail fields first if needed.
+        """
+        if self.hydrated:
+            self.selected.emit(self.data)
+            return
+
+        self._open_pending = True
+        self.load_details(FetchPriority.INTERACTIVE)
+
+
     # ==================================================
     # Loader Callbacks
     # ==================================================
@@ -194,11 +255,8 @@ class WidgetPokemon(QWidget):
             self.type_2.setText(self.types[1])
             self.type_2.show()
 
-        # Pokémon image
-        self.img_pokemon = QPixmap(
-            f"resources/images_pokemon/{data['id']:03d}.png"
-        )
-        self.label_img.setPixmap(self.img_pokemon)
+        # Pokémon image: placeholder until the card nears the viewport
+        self.label_img.setPixmap(placeholder_pixmap(ImageVariant.CARD, self.devicePixelRatioF()))
 
         # Apply dynamic stylesheet based on Pokémon types
         apply_type(self, self.types)
@@ -209,8 +267,67 @@ class WidgetPokemon(QWidget):
         # Play appear animation once data is loaded
         QTimer.singleShot(0, self._playAppearAnimation)
 
+        self.data = data
+
+        # Snapshot records already carry the detail fields
+        self.hydrated = all(field in data for field in DETAIL_FIELDS) and not data.get("missing")
+
         self.loaded.emit()
+
+
+    def load_image(self):
+        """
+        Show the Pokémon image, decoding it unless it is shown or on the way.
+        """
+        if self.state != WidgetState.READY or self._image_requested:
+            return
+
+        self._image_requested = True
+
+        self.image_loader = ImageLoader(self.pokemon_id, ImageVariant.CARD, self.devicePixelRatioF())
+        self.image_loader.finished.connect(self._onImageLoaded)
+        self.image_loader.start()
+
+
+    def release_image(self):
+        """
+        Put the placeholder back; the shared cache decides whether the
+        image stays in memory.
+        """
+        if not self._image_requested:
+            return
+
+        self._image_requested = False
+
+        PixmapCache.instance().drop(self.image_loader.key, self.release_image)
+
+        self.image_loader.cancel()
+        self.image_loader = None
+
+        self.label_img.setPixmap(placeholder_pixmap(ImageVariant.CARD, self.devicePixelRatioF()))
+
+
+    def _onImageLoaded(self, pixmap: QPixmap):
+
+        self.label_img.setPixmap(pixmap)
+
+        # Evicted from the cache: back to the placeholder, the label
+        # must not keep the pixmap alive (reloaded near the viewport)
+        PixmapCache.instance().hold(self.image_loader.key, self.release_image)
+
+
+    def _onHydrated(self, data: dict):
+
+        if self.hydrated:
+            return
+
+        # Partial records stay unhydrated so the next open backfills them
         self.data = data
+        self.hydrated = not data.get("missing")
+
+        if self._open_pending:
+            self._open_pending = False
+            self.selected.emit(self.data)
 
 
     def _onError(self, message: str):
@@ -219,12 +336,34 @@ class WidgetPokemon(QWidget):
         self.failed.emit(self)
 
 
+    def _onDetailsError(self, message: str):
+
+        # Hover prefetches fail silently, they are retried on open
+        if self._open_pending:
+            self._open_pending = False
+            self.detailsFailed.emit(message)
+
+
     def retry_loading(self):
 
         if self.state == WidgetState.ERROR:
             self._startLoading()
 
 
+    def cancel_loading(self):
+        """
+        Abort the pending load, its result will never reach the card.
+        """
+        if hasattr(self, "loader"):
+            self.loader.cancel()
+
+        if self.details_loader:
+            self.details_loader.cancel()
+
+        if self.image_loader:
+            self.release_image()
+
+
     # ==================================================
     # State Management
     # ==================================================
@@ -277,12 +416,20 @@ class WidgetPokemon(QWidget):
     # Mouse Events
     # ==================================================
 
+    def enterEvent(self, event):
+
+        # Hovering hints at an upcoming click: warm the detail profile,
+        # behind the visible cards (open_details() raises it on click)
+        self.load_details(FetchPriority.PREFETCH)
+
+        super().enterEvent(event)
+
     def mousePressEvent(self, event):
 
         if (
             event.button() == Qt.LeftButton
             and self.state == WidgetState.READY
         ):
-            self.selected.emit(self.data)
+            self.open_details()
 
         super().mousePressEvent(event)
\ No newline at end of file
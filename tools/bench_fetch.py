@@ -0,0 +1,243 @@
+from PyQt5.QtCore import QCoreApplication, QElapsedTimer, QObject, Qt, QTimer
+from pathlib import Path
+import argparse
+import asyncio
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from structure.threads.api_pokemon import FetchProfile
+from structure.threads.data_sources import HttpSource
+from structure.threads.fetch_service import FetchService
+from structure.threads.localized_names import LOCALIZATION_PATH
+from structure.threads.pokemon_loader import PokemonLoader
+from structure.threads.rate_limiter import FetchPriority
+from tools.mock_pokeapi import MockProcess
+
+
+# ==================================================
+# Statistics Helpers
+# ==================================================
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100)."""
+
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+
+    return ordered[rank - 1]
+
+
+class StallProbe(QObject):
+    """
+    Runs in the GUI thread: a timer that fires every few milliseconds
+    and records how late it runs, i.e. how long the event loop was
+    kept busy (loader signals, GIL held by the fetch service thread).
+    """
+
+    def __init__(self, interval_ms: int = 5):
+        super().__init__()
+
+        self.interval_ms = interval_ms
+        self.stalls = []
+
+        self._clock = QElapsedTimer()
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+
+        self._clock.start()
+        self._timer.start()
+
+    def _tick(self):
+
+        elapsed = self._clock.restart() / 1000
+        self.stalls.append(max(0.0, elapsed - self.interval_ms / 1000))
+
+    def stop(self) -> list[float]:
+
+        self._timer.stop()
+        return self.stalls
+
+
+# ==================================================
+# Benchmark Run
+# ==================================================
+
+# The loads go through the app's own path: FetchService (shared loop,
+# session, HTTP cache, limiter) and one PokemonLoader per Pokémon, with
+# the results delivered to this thread as signals.
+
+def _wait_startup(service: FetchService):
+    """Blocks until the directory and name tables started with the service are loaded."""
+
+    async def startup():
+        await asyncio.gather(*service.startup_tasks, return_exceptions=True)
+
+    service.submit(startup()).result()
+
+
+def _load_all(app: QCoreApplication, mock: MockProcess, count: int, profile: FetchProfile) -> dict:
+
+    service = FetchService.instance()
+
+    # Service startup traffic is reported apart from the loads
+    _wait_startup(service)
+    startup_requests = sum(mock.stats()["requests"].values())
+    mock.reset()
+
+    latencies = []
+    failures = 0
+    pending = count
+
+    probe = StallProbe()
+    loaders = []
+
+    def done(started: float, ok: bool):
+        nonlocal failures, pending
+
+        if ok:
+            latencies.append(time.perf_counter() - started)
+        else:
+            failures += 1
+
+        pending -= 1
+
+        if pending == 0:
+            app.quit()
+
+    def start_loads():
+
+        for pokemon_id in range(1, count + 1):
+            loader = PokemonLoader(pokemon_id, FetchPriority.VISIBLE, profile)
+            started = time.perf_counter()
+
+            loader.finished.connect(lambda data, started=started: done(started, True))
+            loader.error.connect(lambda message, started=started: done(started, False))
+            loader.start()
+
+            loaders.append(loader)
+
+    probe.start()
+    QTimer.singleShot(0, start_loads)
+
+    started = time.perf_counter()
+    app.exec_()
+    elapsed = time.perf_counter() - started
+
+    stalls = probe.stop()
+    limit = service.api.limiter.limit
+
+    # Closes the HTTP cache and saves the names, as on app exit
+    FetchService.shutdown()
+
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "failures": failures,
+        "limit": limit,
+        "startup_requests": startup_requests,
+        "stalls": stalls
+    }
+
+
+def _report(title: str, result: dict, stats: dict):
+
+    requests = sum(stats["requests"].values())
+    elapsed = result["elapsed"]
+    latencies = result["latencies"]
+
+    print(f"\n{title}")
+    print(f"  Pokémon cargados:   {len(latencies)} ({result['failures']} fallidos) en {elapsed:.2f} s")
+    print(f"  Arranque servicio:  {result['startup_requests']} peticiones (directorio y nombres, no incluidas abajo)")
+    print(f"  Peticiones:         {requests} ({requests / elapsed:.1f} req/s)")
+
+    for endpoint, total in sorted(stats["requests"].items()):
+        print(f"    {endpoint:<18}{total}")
+
+    print(f"  Latencia por carga: p50 {percentile(latencies, 50) * 1000:.0f} ms"
+          f" | p95 {percentile(latencies, 95) * 1000:.0f} ms"
+          f" | p99 {percentile(latencies, 99) * 1000:.0f} ms")
+    print(f"  Retraso hilo UI:    p99 {percentile(result['stalls'], 99) * 1000:.1f} ms"
+          f" | máx {max(result['stalls'], default=0) * 1000:.1f} ms")
+    print(f"  Bytes transferidos: {stats['bytes'] / 1024 / 1024:.2f} MB")
+    print(f"  Límite final:       {result['limit']:.1f} peticiones simultáneas")
+
+
+def _prepare_work_dir(work_dir: str):
+    """
+    The service keeps its files under cache/ and resources/ relative to
+    the working directory: run from a scratch folder holding only the
+    shipped name table, so the app's own cache and snapshot stay out.
+    """
+
+    localization = Path(work_dir) / LOCALIZATION_PATH
+    localization.parent.mkdir(parents=True)
+
+    shutil.copy(LOCALIZATION_PATH, localization)
+    os.chdir(work_dir)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Benchmark del flujo de carga de Pokémon contra el mock local.")
+    parser.add_argument("--count", type=int, default=40, help="Número de Pokémon a cargar")
+    parser.add_argument("--latency", type=float, default=50, help="Latencia media del mock (ms)")
+    parser.add_argument("--jitter", type=float, default=20, help="Variación de latencia (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracción de respuestas 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fracción de respuestas 429")
+    parser.add_argument("--cache", action="store_true", help="Repite la carga con la caché en disco caliente")
+    parser.add_argument("--profile", choices=("card", "detail"), default="detail", help="Campos cargados por Pokémon")
+    parser.add_argument("--decode-process", action="store_true", help="Decodifica las respuestas grandes en procesos aparte")
+    args = parser.parse_args()
+
+    profile = FetchProfile[args.profile.upper()]
+
+    mock = MockProcess(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate
+    )
+
+    FetchService.configure(HttpSource(mock.base_url), args.decode_process)
+
+    app = QCoreApplication(sys.argv)
+    cwd = os.getcwd()
+
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            _prepare_work_dir(work_dir)
+
+            try:
+                result = _load_all(app, mock, args.count, profile)
+                _report("Carga en frío", result, mock.stats())
+
+                # A new service: only the HTTP cache on disk is warm
+                if args.cache:
+                    mock.reset()
+                    result = _load_all(app, mock, args.count, profile)
+                    _report("Carga con caché caliente", result, mock.stats())
+
+            finally:
+                FetchService.shutdown()
+                os.chdir(cwd)
+
+    finally:
+        mock.stop()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+from pathlib import Path
+import argparse
+import json
+import sys
+
+from structure.threads.decoders import (
+    LANGUAGE,
+    NAMES_FIELDS,
+    POKEMON_FIELDS,
+    decode
+)
+from tools.mock_pokeapi import FIXTURES_DIR
+
+
+# ==================================================
+# Decoder Check Configuration
+# ==================================================
+
+# Fixture name -> URL the app requests it from (picks the decoder)
+FIXTURE_URLS = {
+    "pokemon": "https://pokeapi.co/api/v2/pokemon/1/",
+    "pokemon-species": "https://pokeapi.co/api/v2/pokemon-species/1/",
+    "type": "https://pokeapi.co/api/v2/type/1/",
+    "ability": "https://pokeapi.co/api/v2/ability/1/"
+}
+
+
+# ==================================================
+# Reference Projections
+# ==================================================
+#
+# Built from a plain json.loads of the whole document, independent of
+# the parser and shortcuts the decoders use.
+
+def _expected_species(data: dict) -> dict:
+
+    entries = [entry for entry in data["flavor_text_entries"] if entry["language"]["name"] == LANGUAGE]
+    entries = entries or data["flavor_text_entries"][:1]
+
+    return {
+        "id": data["id"],
+        "gender_rate": data["gender_rate"],
+        "description": [
+            {
+                "text": entry["flavor_text"].replace("\n", " ").replace("\f", " ").strip(),
+                "language": entry["language"]["name"]
+            }
+            for entry in entries
+        ]
+    }
+
+
+def expected(name: str, data: dict) -> dict:
+
+    if name == "pokemon":
+        return {field: data[field] for field in POKEMON_FIELDS}
+
+    if name == "pokemon-species":
+        return _expected_species(data)
+
+    return {field: data[field] for field in NAMES_FIELDS}
+
+
+# ==================================================
+# Decoder Check
+# ==================================================
+#
+# Runs every projected decoder against the recorded PokeAPI documents
+# and compares the result with the reference projection.
+
+def check(fixtures_dir: Path) -> list[str]:
+    """Returns one message per decoder whose output does not match."""
+
+    failures = []
+
+    for name, url in FIXTURE_URLS.items():
+        body = (fixtures_dir / f"{name}.json").read_bytes()
+
+        try:
+            decoded = decode(url, body)
+
+        except (KeyError, TypeError) as e:
+            failures.append(f"{name}: el decodificador falló ({type(e).__name__}: {e})")
+            continue
+
+        reference = expected(name, json.loads(body))
+
+        for field in reference:
+            if decoded.get(field) != reference[field]:
+                failures.append(f"{name}: el campo '{field}' no coincide")
+
+    return failures
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Comprueba los decodificadores contra los JSON grabados de PokeAPI.")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    failures = check(args.fixtures)
+
+    for failure in failures:
+        print(failure)
+
+    if failures:
+        sys.exit(1)
+
+    print(f"{len(FIXTURE_URLS)} decodificadores correctos")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from collections import Counter
+from pathlib import Path
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+
+
+# ==================================================
+# Mock Configuration
+# ==================================================
+
+# Recorded PokeAPI documents used as templates for every ID
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Host baked into the recorded URLs, rewritten to the mock address
+RECORDED_BASE_URL = "https://pokeapi.co/api/v2"
+
+# Last National Dex ID served by the mock
+MAX_POKEMON_ID = 1025
+
+# Type IDs with their English and Spanish names
+TYPE_NAMES = {
+    1: ("normal", "Normal"),
+    2: ("fighting", "Lucha"),
+    3: ("flying", "Volador"),
+    4: ("poison", "Veneno"),
+    5: ("ground", "Tierra"),
+    6: ("rock", "Roca"),
+    7: ("bug", "Bicho"),
+    8: ("ghost", "Fantasma"),
+    9: ("steel", "Acero"),
+    10: ("fire", "Fuego"),
+    11: ("water", "Agua"),
+    12: ("grass", "Planta"),
+    13: ("electric", "Eléctrico"),
+    14: ("psychic", "Psíquico"),
+    15: ("ice", "Hielo"),
+    16: ("dragon", "Dragón"),
+    17: ("dark", "Siniestro"),
+    18: ("fairy", "Hada")
+}
+
+# Number of distinct abilities handed out across Pokémon
+ABILITY_COUNT = 300
+
+
+# ==================================================
+# Mock PokeAPI Server
+# ==================================================
+
+class MockPokeAPI:
+    """
+    Local stand-in for pokeapi.co serving the recorded fixtures for
+    /pokemon, /pokemon-species, /type and /ability, with configurable
+    latency, jitter and error injection.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        fixtures_dir: Path = FIXTURES_DIR
+    ):
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.fixtures_dir = Path(fixtures_dir)
+
+        self.server = None
+        self.base_url = None
+
+        # Fixture name -> raw JSON text
+        self._fixtures = {}
+
+        # Traffic counters read by the benchmark
+        self.requests = Counter()
+        self.bytes_sent = 0
+
+    # ==================================================
+    # Lifecycle
+    # ==================================================
+
+    async def start(self, port: int | None = None) -> str:
+        """Starts the server and returns its API base URL."""
+
+        self.server = TestServer(self._make_app(), port=port)
+        await self.server.start_server()
+
+        self.base_url = str(self.server.make_url("/api/v2"))
+        return self.base_url
+
+    async def close(self):
+
+        if self.server:
+            await self.server.close()
+
+    def reset_counters(self):
+
+        self.requests.clear()
+        self.bytes_sent = 0
+
+    def _make_app(self) -> web.Application:
+
+        app = web.Application(middlewares=[self._traffic_middleware])
+
+        app.router.add_get("/api/v2/pokemon/", self._pokemon_list)
+        app.router.add_get("/api/v2/pokemon/{key}/", self._pokemon)
+        app.router.add_get("/api/v2/pokemon-species/", self._species_list)
+        app.router.add_get("/api/v2/pokemon-species/{key}/", self._species)
+        app.router.add_get("/api/v2/type/", self._type_list)
+        app.router.add_get("/api/v2/type/{key}/", self._type)
+        app.router.add_get("/api/v2/ability/", self._ability_list)
+        app.router.add_get("/api/v2/ability/{key}/", self._ability)
+
+        return app
+
+    # ==================================================
+    # Latency & Error Injection
+    # ==================================================
+
+    @web.middleware
+    async def _traffic_middleware(self, request, handler):
+
+        endpoint = request.path.split("/")[3] if request.path.count("/") > 3 else request.path
+        self.requests[endpoint] += 1
+
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        await asyncio.sleep(max(0.0, delay))
+
+        if random.random() < self.throttle_rate:
+            return web.Response(status=429, headers={"Retry-After": "1"})
+
+        if random.random() < self.error_rate:
+            return web.Response(status=503)
+
+        response = await handler(request)
+        self.bytes_sent += response.content_length or 0
+
+        return response
+
+    # ==================================================
+    # Documents
+    # ==================================================
+
+    def _fixture(self, name: str) -> str:
+
+        if name not in self._fixtures:
+            with open(self.fixtures_dir / f"{name}.json", encoding="utf-8") as f:
+                self._fixtures[name] = f.read()
+
+        return self._fixtures[name]
+
+    def _template(self, name: str) -> dict:
+
+        # Point recorded URLs at this server
+        text = self._fixture(name).replace(RECORDED_BASE_URL, self.base_url)
+        return json.loads(text)
+
+    def _respond(self, document: dict) -> web.Response:
+
+        body = json.dumps(document).encode("utf-8")
+        return web.Response(body=body, content_type="application/json")
+
+    def _resolve_id(self, key: str) -> int:
+
+        if key.isdigit():
+            pokemon_id = int(key)
+
+        elif key.startswith("pokemon-") and key[8:].isdigit():
+            pokemon_id = int(key[8:])
+
+        else:
+            raise web.HTTPNotFound()
+
+        if not 1 <= pokemon_id <= MAX_POKEMON_ID:
+            raise web.HTTPNotFound()
+
+        return pokemon_id
+
+    async def _pokemon_list(self, request):
+
+        results = [
+            {"name": f"pokemon-{i}", "url": f"{self.base_url}/pokemon/{i}/"}
+            for i in range(1, MAX_POKEMON_ID + 1)
+        ]
+
+        return self._respond({"count": MAX_POKEMON_ID, "next": None, "previous": None, "results": results})
+
+    async def _species_list(self, request):
+
+        results = [
+            {"name": f"pokemon-{i}", "url": f"{self.base_url}/pokemon-species/{i}/"}
+            for i in range(1, MAX_POKEMON_ID + 1)
+        ]
+
+        return self._respond({"count": MAX_POKEMON_ID, "next": None, "previous": None, "results": results})
+
+    async def _type_list(self, request):
+
+        results = [
+            {"name": english, "url": f"{self.base_url}/type/{type_id}/"}
+            for type_id, (english, _) in TYPE_NAMES.items()
+        ]
+
+        return self._respond({"count": len(results), "next": None, "previous": None, "results": results})
+
+    async def _ability_list(self, request):
+
+        results = [
+            {"name": f"ability-{i}", "url": f"{self.base_url}/ability/{i}/"}
+            for i in range(1, ABILITY_COUNT + 1)
+        ]
+
+        return self._respond({"count": ABILITY_COUNT, "next": None, "previous": None, "results": results})
+
+    async def _pokemon(self, request):
+
+        pokemon_id = self._resolve_id(request.match_info["key"])
+        document = self._template("pokemon")
+
+        document["id"] = pokemon_id
+        document["name"] = f"pokemon-{pokemon_id}"
+        document["species"]["url"] = f"{self.base_url}/pokemon-species/{pokemon_id}/"
+
+        # Spread types and abilities so shared sub-resources behave realistically
+        type_ids = [pokemon_id % 18 + 1, (pokemon_id * 7) % 18 + 1]
+
+        for slot, type_id in zip(document["types"], type_ids):
+            slot["type"] = {"name": TYPE_NAMES[type_id][0], "url": f"{self.base_url}/type/{type_id}/"}
+
+        for offset, slot in enumerate(document["abilities"]):
+            ability_id = (pokemon_id * 3 + offset) % ABILITY_COUNT + 1
+            slot["ability"] = {"name": f"ability-{ability_id}", "url": f"{self.base_url}/ability/{ability_id}/"}
+
+        return self._respond(document)
+
+    async def _species(self, request):
+
+        pokemon_id = self._resolve_id(request.match_info["key"])
+        document = self._template("pokemon-species")
+
+        document["id"] = pokemon_id
+        document["name"] = f"pokemon-{pokemon_id}"
+
+        return self._respond(document)
+
+    async def _type(self, request):
+
+        type_id = int(request.match_info["key"])
+
+        if type_id not in TYPE_NAMES:
+            raise web.HTTPNotFound()
+
+        english, spanish = TYPE_NAMES[type_id]
+        document = self._template("type")
+
+        document["id"] = type_id
+        document["name"] = english
+
+        for entry in document["names"]:
+            language = entry["language"]["name"]
+            entry["name"] = spanish if language == "es" else english if language == "en" else entry["name"]
+
+        return self._respond(document)
+
+    async def _ability(self, request):
+
+        ability_id = int(request.match_info["key"])
+        document = self._template("ability")
+
+        # Keep the recorded names for the recorded ability only
+        if ability_id != document["id"]:
+            document["id"] = ability_id
+            document["name"] = f"ability-{ability_id}"
+
+            for entry in document["names"]:
+                entry["name"] = f"Habilidad {ability_id}" if entry["language"]["name"] == "es" else f"Ability {ability_id}"
+
+        return self._respond(document)
+
+
+# ==================================================
+# Out-of-process Server
+# ==================================================
+#
+# Rendering documents holds the GIL, so benchmarks run the mock in a
+# child process to keep it from slowing down the client under test.
+
+class MockProcess:
+    """
+    Runs a MockPokeAPI in a child process and exposes its counters.
+    """
+
+    def __init__(self, **options):
+
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_run_child,
+            args=(child_conn, options),
+            daemon=True
+        )
+        self._process.start()
+
+        self.base_url = self._conn.recv()
+
+    def stats(self) -> dict:
+
+        self._conn.send("stats")
+        return self._conn.recv()
+
+    def reset(self):
+
+        self._conn.send("reset")
+        self._conn.recv()
+
+    def stop(self):
+
+        self._conn.send("stop")
+        self._process.join(timeout=5)
+
+
+def _run_child(conn, options):
+
+    async def serve():
+
+        mock = MockPokeAPI(**options)
+        conn.send(await mock.start())
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            command = await loop.run_in_executor(None, conn.recv)
+
+            if command == "stats":
+                conn.send({"requests": dict(mock.requests), "bytes": mock.bytes_sent})
+
+            elif command == "reset":
+                mock.reset_counters()
+                conn.send(None)
+
+            else:
+                break
+
+        await mock.close()
+
+    asyncio.run(serve())
+
+
+# ==================================================
+# Standalone Server
+# ==================================================
+
+async def _serve(args):
+
+    mock = MockPokeAPI(args.latency / 1000, args.jitter / 1000, args.error_rate, args.throttle_rate)
+    base_url = await mock.start(args.port)
+
+    print(f"Mock PokeAPI sirviendo en {base_url}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await mock.close()
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Servidor local que imita PokeAPI.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=50, help="Latencia media (ms)")
+    parser.add_argument("--jitter", type=float, default=20, help="Variación de latencia (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracción de respuestas 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fracción de respuestas 429")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()